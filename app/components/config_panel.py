@@ -1,5 +1,8 @@
 import streamlit as st
 from typing import Dict, Any
+from core.algorithms.parallel.backends import DEFAULT_BACKEND, available_backends
+from core.algorithms.registry import registry
+from core.utils.affinity import cpu_topology
 
 class ConfigPanel:
     def __init__(self):
@@ -9,12 +12,8 @@ class ConfigPanel:
             'num_sizes': 5,
             'num_trials': 3,
             'num_processes': 4,
-            'algorithms': [
-                'Merge Sort',
-                'Quick Sort',
-                'Parallel Merge Sort',
-                'Parallel Quick Sort'
-            ]
+            'backends': [DEFAULT_BACKEND],
+            'algorithms': [spec.display_name for spec in registry]
         }
 
     def render(self) -> None:
@@ -26,11 +25,74 @@ class ConfigPanel:
             min_value=100,
             max_value=10000
         )
+        st.sidebar.multiselect(
+            "Algorithms",
+            options=[spec.display_name for spec in registry],
+            default=self.default_config['algorithms'],
+            key='algorithms',
+            help="Only the selected implementations are imported and benchmarked"
+        )
+        st.sidebar.multiselect(
+            "Execution Backends",
+            options=available_backends(),
+            default=self.default_config['backends'],
+            key='backends',
+            help="Parallel algorithms are benchmarked once per selected backend"
+        )
+        st.sidebar.multiselect(
+            "Pin Workers to Sockets",
+            options=list(cpu_topology()),
+            default=[],
+            key='cpu_sockets',
+            help="Leave empty to let the OS schedule workers freely"
+        )
+        st.sidebar.number_input(
+            "Memory Budget (MB, 0 = unlimited)",
+            value=0.0,
+            min_value=0.0,
+            step=16.0,
+            key='memory_budget_mb',
+            help="Algorithms switch to in-place strategies to stay under this budget"
+        )
+        st.sidebar.checkbox(
+            "Isolate Trials",
+            value=False,
+            key='isolation',
+            help="Run each sort trial in a fresh process and report cold and warm timings"
+        )
+        st.sidebar.number_input(
+            "Cache Flush Buffer (MB, 0 = off)",
+            value=0,
+            min_value=0,
+            step=16,
+            key='flush_cache_mb',
+            help="Touch a buffer this large before each cold run to evict CPU caches"
+        )
+        st.sidebar.text_input(
+            "Checkpoint File",
+            value="",
+            key='checkpoint',
+            help="Completed cells are saved here and skipped when the sweep is rerun"
+        )
+        st.sidebar.checkbox(
+            "Profile IPC",
+            value=False,
+            key='profile_ipc',
+            help="Measure pickling bytes, serialization time and queue wait per task"
+        )
 
     def get_parameters(self) -> Dict[str, Any]:
         return {
             'min_size': 1000,
             'max_size': 10000,
             'num_sizes': 3,
-            'num_trials': 2
+            'num_trials': 2,
+            'algorithms': st.session_state.get('algorithms', self.default_config['algorithms']),
+            'backends': st.session_state.get('backends', self.default_config['backends']),
+            'cpu_sockets': st.session_state.get('cpu_sockets', []),
+            'memory_budget_mb': st.session_state.get('memory_budget_mb') or None,
+            'isolation': st.session_state.get('isolation', False),
+            'flush_cache_mb': st.session_state.get('flush_cache_mb', 0),
+            'checkpoint': st.session_state.get('checkpoint') or None,
+            'profile_ipc': st.session_state.get('profile_ipc', False)
         }
\ No newline at end of file
@@ -5,6 +5,11 @@ from typing import Dict, Any
 import plotly.express as px
 import plotly.graph_objects as go
 import logging
+import os
+import tempfile
+import weakref
+from core.benchmark.metrics import aggregate_ipc_metrics, select_fastest_backend
+from core.export import EXPORT_FORMATS, available_formats, export_results
 
 class ResultsView:
     def __init__(self):
@@ -72,9 +77,10 @@ class ResultsView:
                 )
 
         with col3:
-            # Speedup metric
-            sequential_time = results[~results['algorithm'].str.contains('Parallel')]['execution_time'].mean()
-            parallel_time = results[results['algorithm'].str.contains('Parallel')]['execution_time'].mean()
+            # Speedup metric, comparing full sorts only
+            sorts = results[results['task'] == 'sort'] if 'task' in results.columns else results
+            sequential_time = sorts[~sorts['is_parallel']]['execution_time'].mean()
+            parallel_time = sorts[sorts['is_parallel']]['execution_time'].mean()
             speedup = sequential_time / parallel_time if parallel_time > 0 else 0
             st.metric(
                 "Average Speedup",
@@ -112,6 +118,27 @@ class ResultsView:
             }
         )
 
+        # Cheapest backend per implementation and size, when several were swept
+        if 'backend' in results.columns and results.groupby('implementation')['backend'].nunique().max() > 1:
+            st.subheader("Fastest Backend")
+            st.dataframe(select_fastest_backend(results).round(4), hide_index=True)
+
+        # Cold start vs warm steady state, only present for isolated trials
+        if 'cold_time' in results.columns:
+            isolated = results.dropna(subset=['cold_time'])
+            st.subheader("Cold vs Warm Runs")
+            st.dataframe(
+                isolated.groupby(['algorithm', 'input_size'])[['cold_time', 'warm_time', 'cold_penalty']]
+                .mean().round(4).reset_index(),
+                hide_index=True
+            )
+
+        # IPC profile, only present when profiling was enabled
+        ipc_results = aggregate_ipc_metrics(results)
+        if not ipc_results.empty:
+            st.subheader("IPC Profile")
+            st.dataframe(ipc_results.round(4), hide_index=True)
+
     def _display_charts(self, results: pd.DataFrame) -> None:
         """Display performance charts."""
         st.subheader("Performance Charts")
@@ -144,24 +171,66 @@ class ResultsView:
         )
         st.plotly_chart(fig2, use_container_width=True)
 
-        # Display download buttons
+        self._display_export(results)
+
+    def _display_export(self, results: pd.DataFrame) -> None:
+        """Write results to a temporary file in chunks, only when requested.
+
+        The file is written chunk by chunk, but st.download_button still reads
+        the whole file into server memory when it is served. For very large
+        sweeps, call BenchmarkEngine.export_results with a path instead.
+        """
         st.subheader("Export Results")
         col1, col2 = st.columns(2)
-        
+
         with col1:
-            csv = results.to_csv(index=False)
-            st.download_button(
-                label="Download CSV",
-                data=csv,
-                file_name="sorting_benchmark_results.csv",
-                mime="text/csv"
-            )
-            
+            fmt = st.selectbox("Format", options=available_formats(), key='export_format')
+            if st.button("Prepare Export"):
+                self.clear_export()
+                fd, path = tempfile.mkstemp(prefix='sorting_benchmark_', suffix=EXPORT_FORMATS[fmt]['extension'])
+                os.close(fd)
+                prepared = PreparedExport(fmt, path)
+                with st.spinner("Writing export..."):
+                    export_results(results, path, fmt)
+                st.session_state['export_file'] = prepared
+
         with col2:
-            json_str = results.to_json(orient="records", indent=2)
-            st.download_button(
-                label="Download JSON",
-                data=json_str,
-                file_name="sorting_benchmark_results.json",
-                mime="application/json"
-            )
\ No newline at end of file
+            prepared = st.session_state.get('export_file')
+            if prepared and prepared.format == fmt and os.path.exists(prepared.path):
+                spec = EXPORT_FORMATS[fmt]
+                with open(prepared.path, 'rb') as f:
+                    st.download_button(
+                        label=f"Download {fmt.upper()}",
+                        data=f,
+                        file_name=f"sorting_benchmark_results{spec['extension']}",
+                        mime=spec['mime'],
+                        # The data is already held by Streamlit, so the file can go
+                        on_click=self.clear_export
+                    )
+
+    @staticmethod
+    def clear_export() -> None:
+        """Remove the previously prepared export file, if any."""
+        prepared = st.session_state.pop('export_file', None)
+        if prepared is not None:
+            prepared.remove()
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class PreparedExport:
+    """Temporary export file, deleted when replaced, downloaded, or when the
+    session state holding it is discarded or the server exits."""
+
+    def __init__(self, fmt: str, path: str):
+        self.format = fmt
+        self.path = path
+        self._finalizer = weakref.finalize(self, _remove_file, path)
+
+    def remove(self) -> None:
+        self._finalizer()
@@ -3,24 +3,25 @@ import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
+from core.algorithms.registry import registry
 
 class VisualizationDashboard:
     def __init__(self):
-        self.color_scheme = {
-            'Merge Sort': '#1f77b4',
-            'Quick Sort': '#ff7f0e',
-            'Parallel Merge Sort': '#2ca02c',
-            'Parallel Quick Sort': '#d62728'
-        }
+        # Colours come from the algorithm registry so names stay in sync
+        self.color_scheme = registry.color_scheme()
 
     def plot_execution_times(self, results: pd.DataFrame) -> None:
         """Plot execution times for different algorithms and input sizes."""
+        # Colour by implementation and dash by backend so registry colours match
+        color = 'implementation' if 'implementation' in results.columns else 'algorithm'
         fig = px.line(
             results,
             x='input_size',
             y='execution_time',
-            color='algorithm',
+            color=color,
+            line_dash='backend' if 'backend' in results.columns else None,
+            color_discrete_map=self.color_scheme,
             markers=True,
             title='Algorithm Execution Times vs Input Size',
             labels={
@@ -32,50 +33,36 @@ class VisualizationDashboard:
         st.plotly_chart(fig, use_container_width=True)
 
     def plot_speedup_comparison(self, results: pd.DataFrame) -> None:
-        """Plot speedup of parallel vs sequential algorithms."""
-        # Calculate speedup for each algorithm pair
-        speedup_data = []
-        
-        for size in results['input_size'].unique():
-            size_results = results[results['input_size'] == size]
-            
-            # Merge Sort speedup
-            merge_time = size_results[
-                size_results['algorithm'] == 'Merge Sort'
-            ]['execution_time'].mean()
-            parallel_merge_time = size_results[
-                size_results['algorithm'] == 'Parallel Merge Sort'
-            ]['execution_time'].mean()
-            
-            # Quick Sort speedup
-            quick_time = size_results[
-                size_results['algorithm'] == 'Quick Sort'
-            ]['execution_time'].mean()
-            parallel_quick_time = size_results[
-                size_results['algorithm'] == 'Parallel Quick Sort'
-            ]['execution_time'].mean()
-            
-            speedup_data.append({
-                'input_size': size,
-                'Merge Sort Speedup': merge_time / parallel_merge_time,
-                'Quick Sort Speedup': quick_time / parallel_quick_time
-            })
-        
-        speedup_df = pd.DataFrame(speedup_data)
-        
+        """Plot speedup of each parallel implementation and backend over its sequential counterpart."""
+        sorts = results[results['task'] == 'sort'] if 'task' in results.columns else results
+        implementation = sorts['implementation'] if 'implementation' in sorts.columns else sorts['algorithm']
+        backend = sorts['backend'] if 'backend' in sorts.columns else pd.Series('default', index=sorts.index)
+        mean_times = (
+            sorts.assign(implementation=implementation, backend=backend)
+            .groupby(['implementation', 'backend', 'input_size'])['execution_time']
+            .mean()
+        )
+        sequential = (
+            sorts.assign(implementation=implementation)[~sorts['is_parallel']]
+            .groupby(['implementation', 'input_size'])['execution_time']
+            .mean()
+        )
+
         fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=speedup_df['input_size'],
-            y=speedup_df['Merge Sort Speedup'],
-            name='Merge Sort Speedup',
-            mode='lines+markers'
-        ))
-        fig.add_trace(go.Scatter(
-            x=speedup_df['input_size'],
-            y=speedup_df['Quick Sort Speedup'],
-            name='Quick Sort Speedup',
-            mode='lines+markers'
-        ))
+        for (name, backend_name), times in mean_times.groupby(level=['implementation', 'backend']):
+            # 'Parallel Merge Sort' is compared against 'Merge Sort'
+            baseline_name = name.replace('Parallel ', '', 1)
+            if baseline_name == name or baseline_name not in sequential.index.get_level_values(0):
+                continue
+            times = times.droplevel(['implementation', 'backend'])
+            speedup = (sequential.loc[baseline_name] / times).dropna()
+            fig.add_trace(go.Scatter(
+                x=speedup.index,
+                y=speedup.values,
+                name=f"{name} [{backend_name}]",
+                mode='lines+markers',
+                line=dict(color=self.color_scheme.get(name))
+            ))
         
         fig.update_layout(
             title='Parallel Speedup vs Input Size',
@@ -103,7 +90,42 @@ class VisualizationDashboard:
         )
         st.plotly_chart(fig, use_container_width=True)
 
-    def plot_metrics(self, results: pd.DataFrame) -> None:
+    def plot_resource_timeline(self, timelines: Dict[Tuple[str, int, int], List[Dict[str, Any]]]) -> None:
+        """Plot per-core CPU utilization and RSS over time for one trial."""
+        if not timelines:
+            st.info("Enable resource monitoring to record per-core timelines.")
+            return
+
+        keys = list(timelines)
+        selected = st.selectbox(
+            "Trial",
+            options=range(len(keys)),
+            format_func=lambda i: f"{keys[i][0]} | n={keys[i][1]} | trial {keys[i][2]}",
+            key='timeline_trial'
+        )
+        timeline = timelines[keys[selected]]
+        times = [sample['time'] for sample in timeline]
+        per_core = np.array([sample['per_core'] for sample in timeline])
+
+        fig = go.Figure()
+        for core in range(per_core.shape[1]):
+            fig.add_trace(go.Scatter(x=times, y=per_core[:, core], name=f"CPU {core}", mode='lines'))
+        fig.add_trace(go.Scatter(
+            x=times, y=[sample['rss_mb'] for sample in timeline],
+            name='RSS (MB)', mode='lines', line=dict(dash='dot'), yaxis='y2'
+        ))
+        fig.update_layout(
+            title='Per-Core Utilization During Trial',
+            xaxis_title='Time (seconds)',
+            yaxis=dict(title='CPU Utilization (%)', range=[0, 100]),
+            yaxis2=dict(title='RSS (MB)', overlaying='y', side='right'),
+            showlegend=True
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    def plot_metrics(self,
+                     results: pd.DataFrame,
+                     resource_timelines: Dict[Tuple[str, int, int], List[Dict[str, Any]]] = None) -> None:
         """Display all visualization components."""
         st.subheader("Performance Metrics")
         
@@ -112,7 +134,8 @@ class VisualizationDashboard:
             "Execution Times",
             "Parallel Speedup",
             "Memory Usage",
-            "Detailed Analysis"
+            "Detailed Analysis",
+            "Resource Timeline"
         ])
         
         with tabs[0]:
@@ -127,6 +150,9 @@ class VisualizationDashboard:
         with tabs[3]:
             self.plot_detailed_analysis(results)
 
+        with tabs[4]:
+            self.plot_resource_timeline(resource_timelines)
+
     def plot_detailed_analysis(self, results: pd.DataFrame) -> None:
         """Show detailed statistical analysis of results."""
         st.write("Statistical Summary")
@@ -1,22 +1,66 @@
 """
 Sorting Algorithms Module
 -----------------------
-Contains implementations of various sorting algorithms.
+Contains implementations of various sorting algorithms. Implementations are
+imported on first access, see `registry` for the available algorithms.
 """
 
+import importlib
+from collections.abc import Mapping
 from .base import BaseSortingAlgorithm
-from .parallel.parallel_merge import ParallelMergeSort
-from .parallel.parallel_quick import ParallelQuickSort
+from .registry import AlgorithmRegistry, AlgorithmSpec, registry
 
-# Available algorithms
-AVAILABLE_ALGORITHMS = {
-    'merge_sort': ParallelMergeSort,
-    'quick_sort': ParallelQuickSort,
+_LAZY_IMPORTS = {
+    'MergeSort': '.merge_sort',
+    'QuickSort': '.quick_sort',
+    'ParallelMergeSort': '.parallel.parallel_merge',
+    'ParallelQuickSort': '.parallel.parallel_quick',
+    'ParallelSelect': '.parallel.parallel_select',
+    'ParallelBitonicSort': '.parallel.parallel_bitonic',
+    'DistributedSampleSort': '.distributed',
+    'StreamingSorter': '.streaming',
 }
 
+
+class _AvailableAlgorithms(Mapping):
+    """Registry key to implementation class, importing on lookup."""
+
+    def __getitem__(self, key: str) -> type:
+        if key not in registry:
+            raise KeyError(key)
+        return registry.get(key).load()
+
+    def __iter__(self):
+        return iter(registry.keys())
+
+    def __len__(self) -> int:
+        return len(registry)
+
+
+# Available algorithms
+AVAILABLE_ALGORITHMS = _AvailableAlgorithms()
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     'BaseSortingAlgorithm',
+    'MergeSort',
+    'QuickSort',
     'ParallelMergeSort',
     'ParallelQuickSort',
+    'ParallelSelect',
+    'ParallelBitonicSort',
+    'DistributedSampleSort',
+    'StreamingSorter',
+    'AlgorithmRegistry',
+    'AlgorithmSpec',
+    'registry',
     'AVAILABLE_ALGORITHMS'
-]
\ No newline at end of file
+]
@@ -1,18 +1,68 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Sequence
 
 class BaseSortingAlgorithm(ABC):
     """Abstract base class for all sorting algorithms."""
     
-    def __init__(self, name: str, **kwargs):
+    # Approximate bytes per element of a List[int]: 8-byte slot + small int object
+    BYTES_PER_ITEM = 36
+
+    def __init__(self, name: str, memory_budget_mb: float = None, **kwargs):
         self.name = name
         self.config = kwargs
+        # Cap on working memory allocated on top of the input and output lists
+        self.memory_budget_mb = memory_budget_mb
+        self.profiler = None  # Optional IPCProfiler for executor boundaries
+        self.last_run_stats: Dict[str, Any] = {}  # Extra metrics from the latest sort
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Profilers stay in the parent process; workers run unprofiled copies
+        state = self.__dict__.copy()
+        state['profiler'] = None
+        return state
     
     @abstractmethod
     def sort(self, data: List[int]) -> List[int]:
         """Sort the input data and return sorted list."""
         pass
     
+    def argsort(self, keys: Sequence[Any]) -> List[int]:
+        """Return the index permutation that sorts keys, stable on ties."""
+        n = len(keys)
+        if n == 0:
+            return []
+
+        if all(isinstance(k, int) for k in keys):
+            # Pack key and index into one int so only a compact array
+            # crosses the executor boundaries
+            low = min(keys)
+            packed = self.sort([(k - low) * n + i for i, k in enumerate(keys)])
+            return [v % n for v in packed]
+
+        # Fall back to (key, index) pairs for non-integer keys
+        pairs = self.sort([(k, i) for i, k in enumerate(keys)])
+        return [i for _, i in pairs]
+
+    def sort_by_key(self, records: Sequence[Any], key: Callable[[Any], Any]) -> List[Any]:
+        """Sort records by key, moving each payload exactly once."""
+        order = self.argsort([key(record) for record in records])
+        return [records[i] for i in order]
+
+    def estimate_working_memory_mb(self, n: int) -> float:
+        """Estimate the working memory of an unbudgeted sort of n items."""
+        return n * self.BYTES_PER_ITEM / 1024 / 1024
+
+    def budget_items(self, copies: int = 1) -> int:
+        """How many items fit in the memory budget when each is held `copies` times."""
+        if self.memory_budget_mb is None:
+            return 0
+        return int(self.memory_budget_mb * 1024 * 1024 / (self.BYTES_PER_ITEM * copies))
+
+    def needs_budgeting(self, n: int) -> bool:
+        """Whether an unbudgeted sort of n items would exceed the budget."""
+        return (self.memory_budget_mb is not None
+                and self.estimate_working_memory_mb(n) > self.memory_budget_mb)
+
     @property
     def is_parallel(self) -> bool:
         """Whether this is a parallel sorting implementation."""
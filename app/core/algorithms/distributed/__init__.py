@@ -0,0 +1,10 @@
+"""
+Distributed Sorting Implementations
+---------------------------------
+Coordinator and worker daemons for sorting across nodes over TCP.
+"""
+
+from .coordinator import DistributedSampleSort, LocalCluster
+from .worker import SortWorker
+
+__all__ = ['DistributedSampleSort', 'LocalCluster', 'SortWorker']
@@ -0,0 +1,158 @@
+from typing import List, Dict, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor
+import socket
+import time
+import uuid
+from ..base import BaseSortingAlgorithm
+from .protocol import OP_COLLECT, OP_LOAD, OP_SHUTDOWN, OP_SPLIT, request
+from .worker import SortWorker
+
+class LocalCluster:
+    """Localhost stand-in for a set of worker nodes."""
+
+    def __init__(self, num_nodes: int = 2, host: str = '127.0.0.1'):
+        self.workers = [SortWorker(host, 0) for _ in range(num_nodes)]
+        for worker in self.workers:
+            worker.start()
+
+    @property
+    def addresses(self) -> List[Tuple[str, int]]:
+        return [worker.address for worker in self.workers]
+
+    def close(self) -> None:
+        for worker in self.workers:
+            worker.stop()
+        self.workers = []
+
+    def __enter__(self) -> 'LocalCluster':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class DistributedSampleSort(BaseSortingAlgorithm):
+    transport = 'tcp'
+
+    def __init__(self,
+                 workers: List[Tuple[str, int]] = None,
+                 num_nodes: int = 2,
+                 oversampling: int = 16,
+                 timeout: float = 60.0):
+        super().__init__(name="Distributed Sample Sort")
+        self.workers = [tuple(worker) for worker in workers] if workers else None
+        self.num_nodes = len(self.workers) if self.workers else num_nodes
+        self.oversampling = oversampling
+        self.timeout = timeout
+        self._cluster = None
+
+    @property
+    def is_parallel(self) -> bool:
+        return True
+
+    def _addresses(self) -> List[Tuple[str, int]]:
+        if self.workers:
+            return self.workers
+        # No nodes configured, fall back to localhost workers
+        if self._cluster is None:
+            self._cluster = LocalCluster(self.num_nodes)
+        return self._cluster.addresses
+
+    def close(self) -> None:
+        """Stop the localhost workers started by this instance, if any."""
+        if self._cluster is not None:
+            self._cluster.close()
+            self._cluster = None
+
+    def shutdown_workers(self) -> None:
+        """Ask every configured worker daemon to exit."""
+        for address in self._addresses():
+            with socket.create_connection(address, timeout=self.timeout) as conn:
+                request(conn, OP_SHUTDOWN)
+
+    def _choose_splitters(self, samples: List[List[int]], num_buckets: int) -> List[int]:
+        """Pick num_buckets - 1 evenly spaced splitters from the gathered samples."""
+        pooled = sorted(x for sample in samples for x in sample)
+        if not pooled:
+            return []
+        step = len(pooled) / num_buckets
+        return [pooled[int(i * step)] for i in range(1, num_buckets)]
+
+    def sort(self, data: List[int]) -> List[int]:
+        """Sample sort: scatter, broadcast splitters, all-to-all exchange, gather."""
+        if len(data) <= 1:
+            return list(data)
+
+        addresses = self._addresses()
+        nodes = len(addresses)
+        job = uuid.uuid4().hex
+        chunk_size = -(-len(data) // nodes)
+        chunks = [data[i * chunk_size:(i + 1) * chunk_size] for i in range(nodes)]
+        connections = [socket.create_connection(a, timeout=self.timeout) for a in addresses]
+
+        try:
+            with ThreadPoolExecutor(max_workers=nodes) as pool:
+                # Scatter chunks; each node sorts locally and returns a sample
+                start = time.perf_counter()
+                loaded = list(pool.map(
+                    lambda i: request(connections[i], OP_LOAD,
+                                      {'job': job, 'sample_size': self.oversampling * nodes},
+                                      chunks[i]),
+                    range(nodes)
+                ))
+                scatter_time = time.perf_counter() - start
+                splitters = self._choose_splitters([values for _, values, _ in loaded], nodes)
+
+                # Broadcast splitters; nodes exchange buckets directly with each other
+                start = time.perf_counter()
+                exchanged = list(pool.map(
+                    lambda i: request(connections[i], OP_SPLIT,
+                                      {'job': job, 'rank': i, 'peers': addresses},
+                                      splitters),
+                    range(nodes)
+                ))
+                exchange_time = time.perf_counter() - start
+
+                # Gather the merged buckets in splitter order
+                start = time.perf_counter()
+                collected = list(pool.map(
+                    lambda i: request(connections[i], OP_COLLECT,
+                                      {'job': job, 'sources': nodes}),
+                    range(nodes)
+                ))
+                gather_time = time.perf_counter() - start
+        finally:
+            for conn in connections:
+                conn.close()
+
+        coordinator_bytes = sum(moved for stage in (loaded, exchanged, collected)
+                                for _, _, moved in stage)
+        peer_bytes = sum(meta['bytes_sent'] for meta, _, _ in exchanged)
+        self.last_run_stats = {
+            'num_nodes': nodes,
+            'network_bytes': coordinator_bytes + peer_bytes,
+            'exchange_bytes': peer_bytes,
+            'scatter_time': scatter_time,
+            'exchange_time': exchange_time,
+            'gather_time': gather_time,
+        }
+
+        result = []
+        for _, values, _ in collected:
+            result.extend(values)
+        return result
+
+    def get_complexity(self) -> Dict[str, str]:
+        """Return algorithm complexity information."""
+        return {
+            'time_best': 'O((n/p) log n)',
+            'time_average': 'O((n/p) log n)',
+            'time_worst': 'O(n log n)',
+            'space': 'O(n/p) per node',
+            'network': 'O(n) bytes in the all-to-all exchange'
+        }
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = super().__getstate__()
+        state['_cluster'] = None
+        return state
@@ -0,0 +1,107 @@
+"""
+Wire protocol shared by the coordinator and the worker daemons.
+
+Every message is a fixed header followed by a JSON metadata block and a
+binary block of little-endian int64 values:
+
+    | opcode: u8 | meta length: u32 | data length: u64 | meta | data |
+"""
+
+import json
+import socket
+import struct
+import sys
+from array import array
+from typing import Any, Dict, List, Sequence, Tuple
+
+HEADER = struct.Struct('!BIQ')
+
+# Upper bounds checked before any buffer is allocated for a message
+MAX_META_BYTES = 1 << 20
+MAX_DATA_BYTES = 1 << 30
+
+OP_LOAD = 1      # Coordinator -> worker: local chunk, replies with a sample
+OP_SPLIT = 2     # Coordinator -> worker: splitters and peers, triggers exchange
+OP_BUCKET = 3    # Worker -> worker: one bucket of the all-to-all exchange
+OP_COLLECT = 4   # Coordinator -> worker: replies with the merged sorted bucket
+OP_SHUTDOWN = 5
+OP_OK = 6
+OP_ERROR = 7
+
+
+class ProtocolError(Exception):
+    """Raised when a peer sends a malformed or truncated message."""
+
+
+class RemoteWorkerError(RuntimeError):
+    """Raised when a worker replies with an error."""
+
+
+def encode_ints(values: Sequence[int]) -> bytes:
+    """Pack integers as little-endian int64."""
+    packed = array('q', values)
+    if sys.byteorder == 'big':
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def decode_ints(data: bytes) -> List[int]:
+    """Unpack little-endian int64 values."""
+    if len(data) % 8:
+        raise ProtocolError(f"Integer payload of {len(data)} bytes is not a multiple of 8")
+    values = array('q')
+    values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values.tolist()
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        n = sock.recv_into(view[received:], size - received)
+        if n == 0:
+            raise ProtocolError(f"Connection closed after {received} of {size} bytes")
+        received += n
+    return bytes(buffer)
+
+
+def send_message(sock: socket.socket,
+                 opcode: int,
+                 meta: Dict[str, Any] = None,
+                 values: Sequence[int] = ()) -> int:
+    """Send one message and return the number of bytes written."""
+    meta_bytes = json.dumps(meta or {}).encode('utf-8')
+    data = encode_ints(values)
+    sock.sendall(HEADER.pack(opcode, len(meta_bytes), len(data)) + meta_bytes)
+    sock.sendall(data)
+    return HEADER.size + len(meta_bytes) + len(data)
+
+
+def recv_message(sock: socket.socket,
+                 max_data: int = MAX_DATA_BYTES) -> Tuple[int, Dict[str, Any], List[int], int]:
+    """Receive one message as (opcode, meta, values, bytes read)."""
+    opcode, meta_len, data_len = HEADER.unpack(_recv_exact(sock, HEADER.size))
+    if meta_len > MAX_META_BYTES:
+        raise ProtocolError(f"Metadata of {meta_len} bytes exceeds the {MAX_META_BYTES} byte limit")
+    if data_len > max_data:
+        raise ProtocolError(f"Payload of {data_len} bytes exceeds the {max_data} byte limit")
+    meta = json.loads(_recv_exact(sock, meta_len).decode('utf-8')) if meta_len else {}
+    values = decode_ints(_recv_exact(sock, data_len)) if data_len else []
+    return opcode, meta, values, HEADER.size + meta_len + data_len
+
+
+def request(sock: socket.socket,
+            opcode: int,
+            meta: Dict[str, Any] = None,
+            values: Sequence[int] = ()) -> Tuple[Dict[str, Any], List[int], int]:
+    """Send a request and wait for its reply, returning (meta, values, bytes moved)."""
+    sent = send_message(sock, opcode, meta, values)
+    reply, reply_meta, reply_values, received = recv_message(sock)
+    if reply == OP_ERROR:
+        raise RemoteWorkerError(reply_meta.get('error', 'unknown worker error'))
+    if reply != OP_OK:
+        raise ProtocolError(f"Unexpected reply opcode {reply}")
+    return reply_meta, reply_values, sent + received
@@ -0,0 +1,214 @@
+"""
+Sort worker daemon. Run one per node:
+
+    python -m core.algorithms.distributed --port 9500
+
+The daemon is unauthenticated, so it binds to loopback by default. When
+exposing it on a network, also list the hosts it may exchange buckets with
+through --allow-peer.
+"""
+
+import argparse
+import heapq
+import ipaddress
+import socket
+import socketserver
+import threading
+import time
+from bisect import bisect_right
+from typing import Dict, List, Sequence, Tuple
+
+from .protocol import (
+    MAX_DATA_BYTES, OP_BUCKET, OP_COLLECT, OP_ERROR, OP_LOAD, OP_OK, OP_SHUTDOWN,
+    OP_SPLIT, ProtocolError, recv_message, request, send_message,
+)
+
+
+class _Job:
+    """Per-sort state held by a worker between protocol phases."""
+
+    def __init__(self):
+        self.chunk: List[int] = []
+        self.buckets: Dict[int, List[int]] = {}
+        self.ready = threading.Condition()
+        self.last_used = time.monotonic()
+
+
+class _ConnectionHandler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        worker: SortWorker = self.server.worker
+        while True:
+            try:
+                opcode, meta, values, _ = recv_message(self.request, worker.max_message_bytes)
+            except (ProtocolError, ConnectionError):
+                return  # Peer closed the connection or sent an oversized message
+
+            try:
+                reply_meta, reply_values = worker.dispatch(opcode, meta, values)
+                send_message(self.request, OP_OK, reply_meta, reply_values)
+            except Exception as e:
+                send_message(self.request, OP_ERROR, {'error': f"{type(e).__name__}: {e}"})
+
+            if opcode == OP_SHUTDOWN:
+                return
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class SortWorker:
+    """Worker node for the distributed sample sort."""
+
+    def __init__(self,
+                 host: str = '127.0.0.1',
+                 port: int = 0,
+                 timeout: float = 60.0,
+                 allowed_peers: Sequence[str] = (),
+                 max_message_bytes: int = MAX_DATA_BYTES,
+                 job_ttl: float = None):
+        self.timeout = timeout
+        # Jobs untouched this long belong to sorts that failed before collecting
+        self.job_ttl = job_ttl if job_ttl is not None else 2 * timeout
+        # Hosts buckets may be sent to besides loopback addresses
+        self.allowed_peers = set(allowed_peers)
+        self.max_message_bytes = max_message_bytes
+        self._server = _Server((host, port), _ConnectionHandler)
+        self._server.worker = self
+        self._jobs: Dict[str, _Job] = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self._server.server_address[:2]
+
+    def start(self) -> 'SortWorker':
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _job(self, job_id: str) -> _Job:
+        with self._lock:
+            self._expire_jobs()
+            job = self._jobs.setdefault(job_id, _Job())
+            job.last_used = time.monotonic()
+            return job
+
+    def _expire_jobs(self) -> None:
+        """Drop jobs abandoned by their coordinator; the caller holds the lock."""
+        cutoff = time.monotonic() - self.job_ttl
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.last_used < cutoff]:
+            del self._jobs[job_id]
+
+    def _drop_job(self, job_id: str) -> None:
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+    def dispatch(self, opcode: int, meta: Dict, values: List[int]) -> Tuple[Dict, List[int]]:
+        if opcode == OP_LOAD:
+            return self._load(meta, values)
+        if opcode == OP_SPLIT:
+            return self._split(meta, values)
+        if opcode == OP_BUCKET:
+            return self._bucket(meta, values)
+        if opcode == OP_COLLECT:
+            return self._collect(meta)
+        if opcode == OP_SHUTDOWN:
+            threading.Thread(target=self.stop, daemon=True).start()
+            return {}, []
+        raise ProtocolError(f"Unknown opcode {opcode}")
+
+    def _check_peer(self, host: str) -> None:
+        """Refuse to connect to hosts that are neither loopback nor allowed."""
+        if host in self.allowed_peers or host == 'localhost':
+            return
+        try:
+            if ipaddress.ip_address(host).is_loopback:
+                return
+        except ValueError:
+            pass
+        raise PermissionError(f"Peer {host} is not in this worker's allowed peers")
+
+    def _load(self, meta: Dict, values: List[int]) -> Tuple[Dict, List[int]]:
+        """Sort the local chunk and reply with a regular sample of it."""
+        job = self._job(meta['job'])
+        job.chunk = sorted(values)
+
+        sample_size = min(meta['sample_size'], len(job.chunk))
+        step = len(job.chunk) / sample_size if sample_size else 0
+        sample = [job.chunk[int(i * step)] for i in range(sample_size)]
+        return {}, sample
+
+    def _split(self, meta: Dict, splitters: List[int]) -> Tuple[Dict, List[int]]:
+        """Cut the sorted chunk at the splitters and send each bucket to its owner."""
+        job = self._job(meta['job'])
+        rank = meta['rank']
+        peers = [(str(host), int(port)) for host, port in meta['peers']]
+        for host, _ in peers:
+            self._check_peer(host)
+
+        bounds = [0] + [bisect_right(job.chunk, s) for s in splitters] + [len(job.chunk)]
+        bytes_sent = 0
+        start = time.perf_counter()
+
+        for target, peer in enumerate(peers):
+            bucket = job.chunk[bounds[target]:bounds[target + 1]]
+            if target == rank:
+                self._store_bucket(job, rank, bucket)
+                continue
+            with socket.create_connection(peer, timeout=self.timeout) as conn:
+                _, _, moved = request(conn, OP_BUCKET, {'job': meta['job'], 'source': rank}, bucket)
+                bytes_sent += moved
+
+        job.chunk = []
+        return {'bytes_sent': bytes_sent, 'exchange_time': time.perf_counter() - start}, []
+
+    def _store_bucket(self, job: _Job, source: int, bucket: List[int]) -> None:
+        with job.ready:
+            job.buckets[source] = bucket
+            job.ready.notify_all()
+
+    def _bucket(self, meta: Dict, values: List[int]) -> Tuple[Dict, List[int]]:
+        self._store_bucket(self._job(meta['job']), meta['source'], values)
+        return {}, []
+
+    def _collect(self, meta: Dict) -> Tuple[Dict, List[int]]:
+        """Wait for every peer's bucket and merge the sorted runs."""
+        job = self._job(meta['job'])
+        with job.ready:
+            if not job.ready.wait_for(lambda: len(job.buckets) >= meta['sources'], self.timeout):
+                self._drop_job(meta['job'])
+                raise TimeoutError(
+                    f"Received {len(job.buckets)} of {meta['sources']} buckets for job {meta['job']}"
+                )
+            runs = [job.buckets[source] for source in sorted(job.buckets)]
+
+        self._drop_job(meta['job'])
+        return {}, list(heapq.merge(*runs))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Distributed sample sort worker")
+    parser.add_argument('--host', default='127.0.0.1',
+                        help="Interface to bind; the protocol is unauthenticated")
+    parser.add_argument('--port', type=int, default=9500)
+    parser.add_argument('--allow-peer', action='append', default=[], metavar='HOST',
+                        help="Non-loopback host this worker may send buckets to (repeatable)")
+    parser.add_argument('--max-message-mb', type=int, default=MAX_DATA_BYTES >> 20,
+                        help="Largest payload accepted in a single message")
+    args = parser.parse_args()
+
+    worker = SortWorker(args.host, args.port, allowed_peers=args.allow_peer,
+                        max_message_bytes=args.max_message_mb << 20)
+    print(f"Sort worker listening on {worker.address[0]}:{worker.address[1]}")
+    worker.serve_forever()
@@ -1,10 +1,26 @@
 """
 Parallel Sorting Implementations
 ------------------------------
-Contains parallel implementations of sorting algorithms.
+Contains parallel implementations of sorting algorithms, imported on first
+access.
 """
 
-from .parallel_merge import ParallelMergeSort
-from .parallel_quick import ParallelQuickSort
+import importlib
 
-__all__ = ['ParallelMergeSort', 'ParallelQuickSort']
\ No newline at end of file
+_LAZY_IMPORTS = {
+    'ParallelMergeSort': '.parallel_merge',
+    'ParallelQuickSort': '.parallel_quick',
+    'ParallelSelect': '.parallel_select',
+    'ParallelBitonicSort': '.parallel_bitonic',
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ['ParallelMergeSort', 'ParallelQuickSort', 'ParallelSelect', 'ParallelBitonicSort']
@@ -0,0 +1,98 @@
+"""
+Execution Backends
+----------------
+Executor factories the parallel algorithms can run on: worker processes,
+threads (cheap when kernels release the GIL or on free-threaded builds) and
+an inline executor that runs every task sequentially in the caller.
+"""
+
+import sys
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, List, Sequence
+from ...utils.affinity import pin_to_cores
+
+
+class InlineExecutor(Executor):
+    """Executor that runs each task immediately in the calling thread."""
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+class ExecutionBackend(ABC):
+    """Creates executors for a parallel algorithm."""
+
+    name: str = ''
+    # Whether task arguments and results are pickled across the boundary
+    requires_pickling: bool = False
+
+    @abstractmethod
+    def create_executor(self, max_workers: int, cpu_affinity: Sequence[int] = None) -> Executor:
+        pass
+
+
+class ProcessBackend(ExecutionBackend):
+    name = 'process'
+    requires_pickling = True
+
+    def create_executor(self, max_workers: int, cpu_affinity: Sequence[int] = None) -> Executor:
+        if cpu_affinity:
+            return ProcessPoolExecutor(max_workers=max_workers,
+                                       initializer=pin_to_cores,
+                                       initargs=(list(cpu_affinity),))
+        return ProcessPoolExecutor(max_workers=max_workers)
+
+
+class ThreadBackend(ExecutionBackend):
+    name = 'thread'
+
+    def create_executor(self, max_workers: int, cpu_affinity: Sequence[int] = None) -> Executor:
+        # On Linux affinity is per thread, so each pool thread pins itself
+        if cpu_affinity:
+            return ThreadPoolExecutor(max_workers=max_workers,
+                                      initializer=pin_to_cores,
+                                      initargs=(list(cpu_affinity),))
+        return ThreadPoolExecutor(max_workers=max_workers)
+
+
+class InlineBackend(ExecutionBackend):
+    name = 'inline'
+
+    def create_executor(self, max_workers: int, cpu_affinity: Sequence[int] = None) -> Executor:
+        # Tasks run in the caller, which is never re-pinned
+        return InlineExecutor()
+
+
+BACKENDS: Dict[str, ExecutionBackend] = {
+    backend.name: backend
+    for backend in (ProcessBackend(), ThreadBackend(), InlineBackend())
+}
+
+
+def is_free_threaded() -> bool:
+    """Whether the interpreter is running without the GIL."""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+DEFAULT_BACKEND = 'thread' if is_free_threaded() else 'process'
+
+
+def available_backends() -> List[str]:
+    return list(BACKENDS)
+
+
+def get_backend(name: str = None) -> ExecutionBackend:
+    """Look up a backend by name, defaulting to the best one for this build."""
+    name = name or DEFAULT_BACKEND
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Unknown execution backend '{name}', expected one of {available_backends()}"
+        )
+    return BACKENDS[name]
@@ -0,0 +1,131 @@
+"""
+Memory-Budgeted Helpers
+---------------------
+Building blocks for sorting under a memory budget: in-place three-way
+partitioning, merging with a bounded buffer and shipping slices to workers
+without exceeding a cap on items in flight.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Callable, List, Sequence, Tuple
+
+
+def partition_in_place(arr: List[int], lo: int, hi: int) -> Tuple[int, int]:
+    """Three-way partition arr[lo:hi] around its median-of-three.
+
+    Returns (lt, gt) so that arr[lo:lt] < pivot, arr[lt:gt] == pivot and
+    arr[gt:hi] > pivot.
+    """
+    mid = (lo + hi) // 2
+    pivot = sorted((arr[lo], arr[mid], arr[hi - 1]))[1]
+    lt, i, gt = lo, lo, hi
+    while i < gt:
+        if arr[i] < pivot:
+            arr[lt], arr[i] = arr[i], arr[lt]
+            lt += 1
+            i += 1
+        elif arr[i] > pivot:
+            gt -= 1
+            arr[gt], arr[i] = arr[i], arr[gt]
+        else:
+            i += 1
+    return lt, gt
+
+
+def _reverse(arr: List[int], lo: int, hi: int) -> None:
+    hi -= 1
+    while lo < hi:
+        arr[lo], arr[hi] = arr[hi], arr[lo]
+        lo += 1
+        hi -= 1
+
+
+def _rotate(arr: List[int], lo: int, mid: int, hi: int) -> None:
+    """Swap arr[lo:mid] and arr[mid:hi] in place with three reversals."""
+    _reverse(arr, lo, mid)
+    _reverse(arr, mid, hi)
+    _reverse(arr, lo, hi)
+
+
+def _lower_bound(arr: List[int], lo: int, hi: int, value: int) -> int:
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if arr[mid] < value:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _upper_bound(arr: List[int], lo: int, hi: int, value: int) -> int:
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if arr[mid] <= value:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def merge_in_place(arr: List[int], lo: int, mid: int, hi: int, buffer_items: int) -> None:
+    """Stably merge the sorted runs arr[lo:mid] and arr[mid:hi].
+
+    Runs whose left side fits in `buffer_items` are merged through a buffer;
+    larger ones are split by rotation until the pieces fit.
+    """
+    if lo >= mid or mid >= hi or arr[mid - 1] <= arr[mid]:
+        return
+
+    if mid - lo <= max(1, buffer_items):
+        buffer = arr[lo:mid]
+        i, j, k = 0, mid, lo
+        while i < len(buffer) and j < hi:
+            if buffer[i] <= arr[j]:
+                arr[k] = buffer[i]
+                i += 1
+            else:
+                arr[k] = arr[j]
+                j += 1
+            k += 1
+        arr[k:k + len(buffer) - i] = buffer[i:]
+        return
+
+    # Split the larger run in half and find the matching cut in the other
+    if mid - lo >= hi - mid:
+        left_cut = (lo + mid) // 2
+        right_cut = _lower_bound(arr, mid, hi, arr[left_cut])
+    else:
+        right_cut = (mid + hi) // 2
+        left_cut = _upper_bound(arr, lo, mid, arr[right_cut])
+
+    _rotate(arr, left_cut, mid, right_cut)
+    new_mid = left_cut + (right_cut - mid)
+    merge_in_place(arr, lo, left_cut, new_mid, buffer_items)
+    merge_in_place(arr, new_mid, right_cut, hi, buffer_items)
+
+
+def sort_ranges_within_budget(executor,
+                              fn: Callable[[List[int]], List[int]],
+                              arr: List[int],
+                              ranges: Sequence[Tuple[int, int]],
+                              budget_items: int) -> None:
+    """Sort each arr[lo:hi] on the executor, writing results back in place.
+
+    New slices are only submitted while the items in flight stay within
+    `budget_items`; a range larger than the budget runs alone.
+    """
+    in_flight = {}
+
+    def _collect_finished() -> None:
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            lo, hi = in_flight.pop(future)
+            arr[lo:hi] = future.result()
+
+    for lo, hi in ranges:
+        while in_flight and sum(h - l for l, h in in_flight.values()) + (hi - lo) > budget_items:
+            _collect_finished()
+        in_flight[executor.submit(fn, arr[lo:hi])] = (lo, hi)
+
+    while in_flight:
+        _collect_finished()
@@ -0,0 +1,190 @@
+"""
+IPC Profiling
+-----------
+Instrumentation for the executor boundaries used by the parallel algorithms.
+Every payload crossing a submit/map call on a process pool is pickled
+explicitly so that bytes, serialization time and queue wait can be measured
+per task; shared-memory backends record queue wait and compute time only.
+"""
+
+import pickle
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+from .backends import get_backend
+
+
+def _profiled_call(payload: bytes, submitted_at: float) -> Tuple[bytes, Dict[str, float]]:
+    """Run a pickled task inside the worker and report its timings."""
+    started_at = time.time()
+
+    start = time.perf_counter()
+    fn, args, kwargs = pickle.loads(payload)
+    deserialize_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    compute_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result_payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+    serialize_time = time.perf_counter() - start
+
+    return result_payload, {
+        'queue_wait': max(0.0, started_at - submitted_at),
+        'worker_deserialize_time': deserialize_time,
+        'worker_serialize_time': serialize_time,
+        'compute_time': compute_time,
+    }
+
+
+def _timed_call(fn: Callable, args: tuple, kwargs: dict,
+                submitted_at: float) -> Tuple[Any, Dict[str, float]]:
+    """Run a task on a backend that shares memory with the caller."""
+    started_at = time.time()
+
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    compute_time = time.perf_counter() - start
+
+    return result, {
+        'queue_wait': max(0.0, started_at - submitted_at),
+        'worker_deserialize_time': 0.0,
+        'worker_serialize_time': 0.0,
+        'compute_time': compute_time,
+    }
+
+
+class IPCProfiler:
+    """Collects per-task communication statistics for an algorithm run."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.records: List[Dict[str, float]] = []
+
+    def record(self, stats: Dict[str, float]) -> None:
+        with self._lock:
+            self.records.append(stats)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.records = []
+
+    def summary(self) -> Dict[str, float]:
+        """Aggregate the recorded tasks into totals for one run."""
+        with self._lock:
+            records = list(self.records)
+
+        summary = {
+            'ipc_tasks': len(records),
+            'ipc_bytes_sent': sum(r['bytes_sent'] for r in records),
+            'ipc_bytes_received': sum(r['bytes_received'] for r in records),
+            'ipc_serialize_time': sum(
+                r['serialize_time'] + r['worker_serialize_time'] for r in records
+            ),
+            'ipc_deserialize_time': sum(
+                r['deserialize_time'] + r['worker_deserialize_time'] for r in records
+            ),
+            'ipc_queue_wait': sum(r['queue_wait'] for r in records),
+            'ipc_compute_time': sum(r['compute_time'] for r in records),
+        }
+        communication = (
+            summary['ipc_serialize_time']
+            + summary['ipc_deserialize_time']
+            + summary['ipc_queue_wait']
+        )
+        total = communication + summary['ipc_compute_time']
+        summary['ipc_communication_ratio'] = communication / total if total > 0 else 0.0
+        return summary
+
+
+class ProfiledExecutor:
+    """Executor wrapper that measures every payload crossing the boundary."""
+
+    def __init__(self, executor, profiler: IPCProfiler, serialize: bool = True):
+        self._executor = executor
+        self.profiler = profiler
+        # Only process pools pickle payloads; other backends record timings only
+        self.serialize = serialize
+
+    def __enter__(self) -> 'ProfiledExecutor':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.shutdown(wait=True)
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        if not self.serialize:
+            return self._submit_shared(fn, args, kwargs)
+
+        start = time.perf_counter()
+        payload = pickle.dumps((fn, args, kwargs), protocol=pickle.HIGHEST_PROTOCOL)
+        serialize_time = time.perf_counter() - start
+
+        inner = self._executor.submit(_profiled_call, payload, time.time())
+        outer = Future()
+
+        def _on_done(done: Future) -> None:
+            try:
+                result_payload, stats = done.result()
+                start = time.perf_counter()
+                result = pickle.loads(result_payload)
+                deserialize_time = time.perf_counter() - start
+            except BaseException as e:
+                outer.set_exception(e)
+                return
+
+            stats.update({
+                'bytes_sent': len(payload),
+                'bytes_received': len(result_payload),
+                'serialize_time': serialize_time,
+                'deserialize_time': deserialize_time,
+            })
+            self.profiler.record(stats)
+            outer.set_result(result)
+
+        inner.add_done_callback(_on_done)
+        return outer
+
+    def _submit_shared(self, fn: Callable, args: tuple, kwargs: dict) -> Future:
+        inner = self._executor.submit(_timed_call, fn, args, kwargs, time.time())
+        outer = Future()
+
+        def _on_done(done: Future) -> None:
+            try:
+                result, stats = done.result()
+            except BaseException as e:
+                outer.set_exception(e)
+                return
+
+            stats.update({
+                'bytes_sent': 0,
+                'bytes_received': 0,
+                'serialize_time': 0.0,
+                'deserialize_time': 0.0,
+            })
+            self.profiler.record(stats)
+            outer.set_result(result)
+
+        inner.add_done_callback(_on_done)
+        return outer
+
+    def map(self, fn: Callable, *iterables: Iterable) -> Iterator[Any]:
+        futures = [self.submit(fn, *args) for args in zip(*iterables)]
+        return (future.result() for future in futures)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+def make_executor(max_workers: int,
+                  profiler: IPCProfiler = None,
+                  backend: str = None,
+                  cpu_affinity: Sequence[int] = None):
+    """Create an executor for the backend, wrapped for profiling when a profiler is given."""
+    execution_backend = get_backend(backend)
+    executor = execution_backend.create_executor(max_workers, cpu_affinity)
+    if profiler is None:
+        return executor
+    return ProfiledExecutor(executor, profiler, execution_backend.requires_pickling)
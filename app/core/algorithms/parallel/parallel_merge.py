@@ -1,12 +1,17 @@
-from typing import List
-from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
 import multiprocessing as mp
 from ..base import BaseSortingAlgorithm
+from .ipc import make_executor
+from .backends import get_backend
+from .budget import merge_in_place, sort_ranges_within_budget
 
 class ParallelMergeSort(BaseSortingAlgorithm):
-    def __init__(self, num_processes: int = None):
-        super().__init__(name="Parallel Merge Sort")
+    def __init__(self, num_processes: int = None, backend: str = None,
+                 cpu_affinity: List[int] = None, memory_budget_mb: float = None):
+        super().__init__(name="Parallel Merge Sort", memory_budget_mb=memory_budget_mb)
         self.num_processes = num_processes or mp.cpu_count()
+        self.backend = get_backend(backend).name
+        self.cpu_affinity = cpu_affinity  # Cores the workers are pinned to
 
     @property
     def is_parallel(self) -> bool:
@@ -28,6 +33,9 @@ class ParallelMergeSort(BaseSortingAlgorithm):
         result.extend(right[j:])
         return result
 
+    def _merge_pair(self, pair: Tuple[List[int], List[int]]) -> List[int]:
+        return self.merge(pair[0], pair[1])
+
     def _sequential_sort(self, arr: List[int]) -> List[int]:
         if len(arr) <= 1:
             return arr
@@ -38,16 +46,51 @@ class ParallelMergeSort(BaseSortingAlgorithm):
         
         return self.merge(left, right)
 
+    def _copies_in_flight(self) -> int:
+        # Chunk slice, worker-side sort temporaries and the sorted result,
+        # plus both pickled payloads when workers are separate processes
+        return 5 if get_backend(self.backend).requires_pickling else 3
+
+    def estimate_working_memory_mb(self, n: int) -> float:
+        # Chunks and every merge round are held alongside the input
+        return n * self.BYTES_PER_ITEM * (self._copies_in_flight() + 1) / 1024 / 1024
+
+    def _budgeted_sort(self, data: List[int]) -> List[int]:
+        """Sort chunks within the budget, then merge them in place."""
+        arr = list(data)
+        n = len(arr)
+
+        # Fewer items in flight at once, written back into arr as they finish
+        in_flight = max(1, self.budget_items(self._copies_in_flight()))
+        chunk_size = max(1, min(-(-n // self.num_processes), in_flight))
+        ranges = [(i, min(i + chunk_size, n)) for i in range(0, n, chunk_size)]
+        with make_executor(self.num_processes, self.profiler, self.backend, self.cpu_affinity) as executor:
+            sort_ranges_within_budget(executor, self._sequential_sort, arr, ranges, in_flight)
+
+        # Bottom-up merging of adjacent runs with a buffer bounded by the budget
+        buffer_items = self.budget_items()
+        width = chunk_size
+        while width < n:
+            for lo in range(0, n - width, 2 * width):
+                merge_in_place(arr, lo, lo + width, min(lo + 2 * width, n), buffer_items)
+            width *= 2
+
+        self.last_run_stats = {'memory_strategy': 'in_place_merge', 'chunk_size': chunk_size}
+        return arr
+
     def sort(self, data: List[int]) -> List[int]:
         if len(data) <= 1000:  # Use sequential for small arrays
             return self._sequential_sort(data)
 
+        if self.needs_budgeting(len(data)):
+            return self._budgeted_sort(data)
+
         # Split data into chunks
         chunk_size = len(data) // self.num_processes
         chunks = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
 
         # Sort chunks in parallel
-        with ProcessPoolExecutor(max_workers=self.num_processes) as executor:
+        with make_executor(self.num_processes, self.profiler, self.backend, self.cpu_affinity) as executor:
             sorted_chunks = list(executor.map(self._sequential_sort, chunks))
 
         # Merge sorted chunks
@@ -58,9 +101,7 @@ class ParallelMergeSort(BaseSortingAlgorithm):
             if len(sorted_chunks) % 2:
                 pairs.append((sorted_chunks[-1], []))
 
-            with ProcessPoolExecutor(max_workers=self.num_processes) as executor:
-                sorted_chunks = list(executor.map(
-                    lambda x: self.merge(x[0], x[1]), pairs
-                ))
+            with make_executor(self.num_processes, self.profiler, self.backend, self.cpu_affinity) as executor:
+                sorted_chunks = list(executor.map(self._merge_pair, pairs))
 
         return sorted_chunks[0]
\ No newline at end of file
@@ -1,44 +1,47 @@
 from typing import List, Dict, Tuple
-from concurrent.futures import ProcessPoolExecutor
 import multiprocessing as mp
 from ..base import BaseSortingAlgorithm
+from .ipc import make_executor
+from .backends import get_backend
+from .budget import partition_in_place, sort_ranges_within_budget
 
 class ParallelQuickSort(BaseSortingAlgorithm):
-    def __init__(self, num_processes: int = None):
-        super().__init__(name="Parallel Quick Sort")
+    def __init__(self, num_processes: int = None, backend: str = None,
+                 cpu_affinity: List[int] = None, memory_budget_mb: float = None):
+        super().__init__(name="Parallel Quick Sort", memory_budget_mb=memory_budget_mb)
         self.num_processes = num_processes or mp.cpu_count()
+        self.backend = get_backend(backend).name
+        self.cpu_affinity = cpu_affinity  # Cores the workers are pinned to
         self.min_partition_size = 1000  # Minimum size for parallel processing
 
     @property
     def is_parallel(self) -> bool:
         return True
 
-    def partition(self, arr: List[int], low: int, high: int) -> Tuple[int, List[int]]:
-        """Partition the array and return pivot index."""
-        pivot = arr[high]
-        i = low - 1
-        
-        for j in range(low, high):
-            if arr[j] <= pivot:
-                i += 1
-                arr[i], arr[j] = arr[j], arr[i]
-                
-        arr[i + 1], arr[high] = arr[high], arr[i + 1]
-        return i + 1, arr
+    def partition(self, arr: List[int], low: int, high: int) -> Tuple[int, int]:
+        """Three-way partition arr[low:high + 1] around its median-of-three.
+
+        Returns (lt, gt) so that arr[lt:gt] holds the keys equal to the pivot.
+        """
+        return partition_in_place(arr, low, high + 1)
 
     def _sequential_sort(self, arr: List[int], low: int, high: int) -> List[int]:
-        """Sequential quicksort implementation."""
-        if low < high:
-            pivot_idx, arr = self.partition(arr, low, high)
-            
-            arr = self._sequential_sort(arr, low, pivot_idx - 1)
-            arr = self._sequential_sort(arr, pivot_idx + 1, high)
-            
+        """Sequential quicksort of arr[low:high + 1] in place."""
+        # Explicit stack; the smaller side is popped first so it stays O(log n)
+        stack = [(low, high)]
+        while stack:
+            low, high = stack.pop()
+            if low < high:
+                lt, gt = self.partition(arr, low, high)
+                sides = sorted([(low, lt - 1), (gt, high)], key=lambda s: s[1] - s[0], reverse=True)
+                stack.extend(sides)
+
         return arr
 
-    def _parallel_partition(self, arr: List[int]) -> Tuple[List[int], List[int], List[int]]:
+    def _parallel_partition(self, arr: List[int], pivot: int = None) -> Tuple[List[int], List[int], List[int]]:
         """Partition array into three parts for parallel processing."""
-        pivot = arr[len(arr) // 2]
+        if pivot is None:
+            pivot = arr[len(arr) // 2]
         left = [x for x in arr if x < pivot]
         middle = [x for x in arr if x == pivot]
         right = [x for x in arr if x > pivot]
@@ -51,26 +54,91 @@ class ParallelQuickSort(BaseSortingAlgorithm):
             return partition
         return self._sequential_sort(partition.copy(), 0, len(partition) - 1)
 
+    def _copies_in_flight(self) -> int:
+        # Slice, worker copy and result, plus pickled payloads for processes
+        return 5 if get_backend(self.backend).requires_pickling else 3
+
+    def estimate_working_memory_mb(self, n: int) -> float:
+        # Three filtered lists per level plus the copies shipped to workers
+        return n * self.BYTES_PER_ITEM * (self._copies_in_flight() + 3) / 1024 / 1024
+
+    def _budgeted_sort(self, data: List[int]) -> List[int]:
+        """Partition in place and ship only leaves that fit the budget."""
+        arr = list(data)
+        in_flight = self.budget_items(self._copies_in_flight())
+
+        # Under very tight budgets sort everything in place in this process
+        ship = in_flight >= self.min_partition_size
+        leaf_size = self.min_partition_size
+        if ship:
+            leaf_size = min(max(-(-len(arr) // self.num_processes), self.min_partition_size), in_flight)
+
+        ranges = []
+        stack = [(0, len(arr))]
+        while stack:
+            lo, hi = stack.pop()
+            if hi - lo <= 1:
+                continue
+            if hi - lo <= leaf_size:
+                if ship:
+                    ranges.append((lo, hi))
+                else:
+                    self._sequential_sort(arr, lo, hi - 1)
+                continue
+            lt, gt = partition_in_place(arr, lo, hi)
+            stack.append((lo, lt))
+            stack.append((gt, hi))
+
+        if ranges:
+            with make_executor(self.num_processes, self.profiler, self.backend, self.cpu_affinity) as executor:
+                sort_ranges_within_budget(executor, self._sort_partition, arr, ranges, in_flight)
+
+        self.last_run_stats = {
+            'memory_strategy': 'in_place_partition' if ship else 'in_place_sequential',
+            'chunk_size': leaf_size
+        }
+        return arr
+
+    def _split_leaves(self, data: List[int], leaf_size: int) -> List[Tuple[List[int], bool]]:
+        """Partition down to leaves of at most leaf_size, in output order.
+
+        Each leaf is paired with whether it still needs sorting; runs of keys
+        equal to a pivot are already in place.
+        """
+        leaves = []
+        stack = [(data, True)]
+        while stack:
+            part, needs_sort = stack.pop()
+            if not needs_sort or len(part) <= leaf_size:
+                leaves.append((part, needs_sort and len(part) > 1))
+                continue
+            left, middle, right = self._parallel_partition(part)
+            stack.extend([(right, True), (middle, False), (left, True)])
+        return leaves
+
     def sort(self, data: List[int]) -> List[int]:
         """Main parallel quicksort implementation."""
         if len(data) <= self.min_partition_size:
             return self._sequential_sort(data.copy(), 0, len(data) - 1)
 
-        # Perform initial partition
-        left, middle, right = self._parallel_partition(data)
+        if self.needs_budgeting(len(data)):
+            return self._budgeted_sort(data)
 
-        # Process partitions in parallel
-        with ProcessPoolExecutor(max_workers=self.num_processes) as executor:
-            # Sort left and right partitions in parallel
-            future_left = executor.submit(self.sort, left)
-            future_right = executor.submit(self.sort, right)
+        # Partition in this process so a single pool sorts every leaf; workers
+        # never open pools of their own, which the profiler could not see
+        leaf_size = max(-(-len(data) // self.num_processes), self.min_partition_size)
+        leaves = self._split_leaves(data, leaf_size)
 
-            # Wait for results
-            sorted_left = future_left.result()
-            sorted_right = future_right.result()
+        with make_executor(self.num_processes, self.profiler, self.backend, self.cpu_affinity) as executor:
+            futures = [
+                executor.submit(self._sort_partition, part) if needs_sort else None
+                for part, needs_sort in leaves
+            ]
+            result = []
+            for (part, _), future in zip(leaves, futures):
+                result.extend(future.result() if future is not None else part)
 
-        # Combine results
-        return sorted_left + middle + sorted_right
+        return result
 
     def get_complexity(self) -> Dict[str, str]:
         """Return algorithm complexity information."""
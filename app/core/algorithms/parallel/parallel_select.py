@@ -0,0 +1,190 @@
+from typing import List, Dict, Sequence, Tuple
+import heapq
+import math
+from .parallel_quick import ParallelQuickSort
+from .ipc import make_executor
+
+class ParallelSelect(ParallelQuickSort):
+    """Parallel selection: nth-element, top-k, partial sort and quantiles."""
+
+    def __init__(self, num_processes: int = None, backend: str = None,
+                 cpu_affinity: List[int] = None):
+        super().__init__(num_processes, backend, cpu_affinity)
+        self.name = "Parallel Select"
+
+    def _local_top_k(self, chunk: List[int], k: int, largest: bool) -> List[int]:
+        """Keep the local top-k of a single chunk."""
+        if largest:
+            return heapq.nlargest(k, chunk)
+        return heapq.nsmallest(k, chunk)
+
+    def top_k(self, data: List[int], k: int, largest: bool = False) -> List[int]:
+        """Return the k smallest (or largest) elements in sorted order."""
+        k = min(k, len(data))
+        if k <= 0:
+            return []
+        if len(data) <= self.min_partition_size:
+            return self._local_top_k(data, k, largest)
+
+        # Each worker keeps a local top-k, merged in the parent
+        chunk_size = math.ceil(len(data) / self.num_processes)
+        chunks = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+        with make_executor(self.num_processes, self.profiler, self.backend, self.cpu_affinity) as executor:
+            local = list(executor.map(
+                self._local_top_k, chunks, [k] * len(chunks), [largest] * len(chunks)
+            ))
+
+        return self._local_top_k([x for part in local for x in part], k, largest)
+
+    def partial_sort(self, data: List[int], k: int) -> List[int]:
+        """Return data with its k smallest elements sorted at the front."""
+        head = self.top_k(data, k)
+        if not head:
+            return list(data)
+
+        # Everything after the sorted head keeps its original order
+        boundary = head[-1]
+        taken = head.count(boundary)
+        tail = []
+        for x in data:
+            if x == boundary and taken:
+                taken -= 1
+            elif x >= boundary:
+                tail.append(x)
+
+        return head + tail
+
+    def _median_of_medians(self, arr: List[int]) -> int:
+        """Pivot with a guaranteed split, used once introselect degrades."""
+        medians = [
+            sorted(arr[i:i + 5])[(min(5, len(arr) - i) - 1) // 2]
+            for i in range(0, len(arr), 5)
+        ]
+        if len(medians) <= 5:
+            return sorted(medians)[(len(medians) - 1) // 2]
+        return self._select(medians, [(len(medians) - 1) // 2], 0, False)[(len(medians) - 1) // 2]
+
+    def _select(self, arr: List[int], ranks: List[int], depth: int, parallel: bool) -> Dict[int, int]:
+        """Introselect for a batch of sorted, distinct ranks within arr."""
+        if not ranks:
+            return {}
+        if len(arr) <= self.min_partition_size:
+            ordered = self._sort_partition(arr)
+            return {r: ordered[r] for r in ranks}
+
+        # Fall back to median-of-medians pivots after too many poor splits
+        pivot = None
+        if depth > 2 * math.log2(len(arr)):
+            pivot = self._median_of_medians(arr)
+        left, middle, right = self._parallel_partition(arr, pivot)
+
+        lo, hi = len(left), len(left) + len(middle)
+        left_ranks = [r for r in ranks if r < lo]
+        right_ranks = [r - hi for r in ranks if r >= hi]
+        selected = {r: middle[0] for r in ranks if lo <= r < hi}
+
+        if parallel and left_ranks and right_ranks:
+            # Both sides hold requested ranks, resolve them concurrently
+            with make_executor(self.num_processes, self.profiler, self.backend, self.cpu_affinity) as executor:
+                future_left = executor.submit(self._select, left, left_ranks, depth + 1, False)
+                future_right = executor.submit(self._select, right, right_ranks, depth + 1, False)
+                found_left = future_left.result()
+                found_right = future_right.result()
+        else:
+            found_left = self._select(left, left_ranks, depth + 1, parallel)
+            found_right = self._select(right, right_ranks, depth + 1, parallel)
+
+        selected.update(found_left)
+        selected.update({r + hi: v for r, v in found_right.items()})
+        return selected
+
+    def _count_around(self, chunk: List[int], pivot: int) -> Tuple[int, int, int]:
+        """Count the elements of a chunk below, equal to and above pivot."""
+        below = above = 0
+        for x in chunk:
+            if x < pivot:
+                below += 1
+            elif x > pivot:
+                above += 1
+        return below, len(chunk) - below - above, above
+
+    def _keep_side(self, chunk: List[int], pivot: int, below: bool) -> List[int]:
+        """Keep only the chunk elements on one side of pivot."""
+        if below:
+            return [x for x in chunk if x < pivot]
+        return [x for x in chunk if x > pivot]
+
+    def _chunk_pivot(self, chunks: List[List[int]]) -> int:
+        """Median of the chunks' middle elements, cheap to compute in the parent."""
+        samples = sorted(
+            sorted((c[0], c[len(c) // 2], c[-1]))[1] for c in chunks if c
+        )
+        return samples[len(samples) // 2]
+
+    def nth_element(self, data: List[int], n: int) -> int:
+        """Return the element that would be at index n after sorting.
+
+        Parallel quickselect: workers count each chunk around the pivot and
+        drop the side that cannot hold rank n; the parent only tracks counts.
+        """
+        if not 0 <= n < len(data):
+            raise IndexError(f"nth_element index {n} out of range for {len(data)} elements")
+        if len(data) <= self.min_partition_size:
+            return self._select(data, [n], 0, False)[n]
+
+        chunk_size = math.ceil(len(data) / self.num_processes)
+        chunks = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+        remaining = len(data)
+        rounds = 0
+
+        with make_executor(self.num_processes, self.profiler, self.backend, self.cpu_affinity) as executor:
+            while remaining > self.min_partition_size:
+                rounds += 1
+                # Guaranteed split once sampled pivots keep missing
+                if rounds > 2 * math.log2(len(data)):
+                    pivot = self._median_of_medians([x for c in chunks for x in c])
+                else:
+                    pivot = self._chunk_pivot(chunks)
+
+                counts = list(executor.map(self._count_around, chunks, [pivot] * len(chunks)))
+                below = sum(c[0] for c in counts)
+                equal = sum(c[1] for c in counts)
+                if below <= n < below + equal:
+                    return pivot
+
+                keep_below = n < below
+                if not keep_below:
+                    n -= below + equal
+                chunks = [
+                    chunk for chunk in executor.map(
+                        self._keep_side, chunks, [pivot] * len(chunks), [keep_below] * len(chunks)
+                    ) if chunk
+                ]
+                remaining = below if keep_below else remaining - below - equal
+
+        rest = [x for c in chunks for x in c]
+        return self._select(rest, [n], 0, False)[n]
+
+    def select_quantiles(self, data: List[int], quantiles: Sequence[float]) -> List[int]:
+        """Select several quantiles in one batched pass (nearest-rank)."""
+        if not data:
+            raise ValueError("Cannot select quantiles of empty data")
+        for q in quantiles:
+            if not 0.0 <= q <= 1.0:
+                raise ValueError(f"Quantile {q} outside [0, 1]")
+
+        ranks = [round(q * (len(data) - 1)) for q in quantiles]
+        selected = self._select(data, sorted(set(ranks)), 0, True)
+        return [selected[r] for r in ranks]
+
+    def get_complexity(self) -> Dict[str, str]:
+        """Return algorithm complexity information."""
+        return {
+            'time_best': 'O(n)',
+            'time_average': 'O(n)',
+            'time_worst': 'O(n)',
+            'time_top_k': 'O(n log k)',
+            'space': 'O(n)',
+            'parallel_speedup': 'O(p)'
+        }
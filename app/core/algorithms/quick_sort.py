@@ -0,0 +1,37 @@
+from typing import List, Dict, Tuple
+from .base import BaseSortingAlgorithm
+from .parallel.budget import partition_in_place
+
+class QuickSort(BaseSortingAlgorithm):
+    def __init__(self):
+        super().__init__(name="Quick Sort")
+
+    def partition(self, arr: List[int], low: int, high: int) -> Tuple[int, int]:
+        """Three-way partition arr[low:high + 1] around its median-of-three.
+
+        Returns (lt, gt) so that arr[lt:gt] holds the keys equal to the pivot.
+        """
+        return partition_in_place(arr, low, high + 1)
+
+    def sort(self, data: List[int]) -> List[int]:
+        """Sequential quicksort implementation."""
+        arr = data.copy()
+        # Explicit stack; the smaller side is popped first so it stays O(log n)
+        stack = [(0, len(arr) - 1)]
+
+        while stack:
+            low, high = stack.pop()
+            if low < high:
+                lt, gt = self.partition(arr, low, high)
+                sides = sorted([(low, lt - 1), (gt, high)], key=lambda s: s[1] - s[0], reverse=True)
+                stack.extend(sides)
+
+        return arr
+
+    def get_complexity(self) -> Dict[str, str]:
+        return {
+            'time_best': 'O(n)',
+            'time_average': 'O(n log n)',
+            'time_worst': 'O(n²)',
+            'space': 'O(n)'
+        }
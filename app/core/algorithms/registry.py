@@ -0,0 +1,183 @@
+"""
+Algorithm Registry
+----------------
+Declares the sorting algorithms the benchmark can run, with capability
+metadata, and imports an implementation only when it is first needed.
+
+Third-party packages can add algorithms through the
+`parallel_sort_benchmark.algorithms` entry point group. Each entry point
+must resolve to an `AlgorithmSpec`, or to a callable that returns one or
+more specs. Keep that module light, because the implementation itself is
+only imported from `spec.target` when it is created.
+"""
+
+import importlib
+from importlib.metadata import entry_points
+from typing import Any, Dict, Iterator, List, Sequence
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+ENTRY_POINT_GROUP = 'parallel_sort_benchmark.algorithms'
+
+# Bump whenever a key starts naming a different implementation, so results
+# stored under the old meaning (e.g. regression baselines) are not reused.
+# Version 2: 'merge_sort'/'quick_sort' became the sequential sorts.
+REGISTRY_VERSION = 2
+
+
+class AlgorithmSpec:
+    """Capabilities of a sorting algorithm and where to import it from."""
+
+    def __init__(self,
+                 key: str,
+                 display_name: str,
+                 target: str,
+                 parallel: bool = False,
+                 stable: bool = False,
+                 in_place: bool = False,
+                 dtypes: Sequence[str] = ('int', 'float', 'str', 'record'),
+                 budget_aware: bool = False,
+                 color: str = None):
+        self.key = key
+        self.display_name = display_name
+        # 'package.module:ClassName'; a leading '.' is relative to core.algorithms
+        self.target = target
+        self.parallel = parallel
+        self.stable = stable
+        self.in_place = in_place
+        # 'record' means whole tuples can be sorted, not only scalar keys
+        self.dtypes = tuple(dtypes)
+        # Switches to a bounded-memory strategy when memory_budget_mb is set
+        self.budget_aware = budget_aware
+        self.color = color
+        self._cls = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._cls is not None
+
+    def load(self) -> type:
+        """Import and return the implementation class."""
+        if self._cls is None:
+            module_name, _, attr = self.target.partition(':')
+            module = importlib.import_module(module_name, package=__package__)
+            self._cls = getattr(module, attr)
+        return self._cls
+
+    def create(self, num_processes: int = None, **kwargs) -> Any:
+        """Instantiate the algorithm; sequential ones take no process count."""
+        cls = self.load()
+        if self.parallel:
+            return cls(num_processes, **kwargs)
+        return cls(**kwargs)
+
+    def matches(self,
+                parallel: bool = None,
+                stable: bool = None,
+                in_place: bool = None,
+                dtype: str = None) -> bool:
+        """Whether the spec satisfies every capability filter that is set."""
+        return (
+            (parallel is None or self.parallel == parallel)
+            and (stable is None or self.stable == stable)
+            and (in_place is None or self.in_place == in_place)
+            and (dtype is None or dtype in self.dtypes)
+        )
+
+    def __repr__(self) -> str:
+        return f"AlgorithmSpec({self.key!r}, target={self.target!r})"
+
+
+class AlgorithmRegistry:
+    """Algorithm specs by key, with entry point plugins discovered on first use."""
+
+    def __init__(self, specs: Sequence[AlgorithmSpec] = (), group: str = ENTRY_POINT_GROUP):
+        self._specs: Dict[str, AlgorithmSpec] = {}
+        self.group = group
+        self._discovered = group is None
+        for spec in specs:
+            self.register(spec)
+
+    def register(self, spec: AlgorithmSpec) -> AlgorithmSpec:
+        if spec.key in self._specs:
+            raise ValueError(f"Algorithm '{spec.key}' is already registered")
+        self._specs[spec.key] = spec
+        return spec
+
+    def discover(self) -> None:
+        """Register specs published through the entry point group."""
+        self._discovered = True
+        for entry_point in entry_points(group=self.group):
+            try:
+                loaded = entry_point.load()
+                specs = loaded() if callable(loaded) and not isinstance(loaded, AlgorithmSpec) else loaded
+                for spec in specs if isinstance(specs, (list, tuple)) else [specs]:
+                    self.register(spec)
+            except Exception as e:
+                # A broken plugin must not take the built-in algorithms down with it
+                logger.warning("Skipping algorithm plugin %s: %s", entry_point.name, e)
+
+    def _ensure_discovered(self) -> None:
+        if not self._discovered:
+            self.discover()
+
+    def __contains__(self, key: str) -> bool:
+        self._ensure_discovered()
+        return key in self._specs
+
+    def __iter__(self) -> Iterator[AlgorithmSpec]:
+        self._ensure_discovered()
+        return iter(list(self._specs.values()))
+
+    def __len__(self) -> int:
+        self._ensure_discovered()
+        return len(self._specs)
+
+    def keys(self) -> List[str]:
+        self._ensure_discovered()
+        return list(self._specs)
+
+    def get(self, key: str) -> AlgorithmSpec:
+        """Look up a spec by key or display name."""
+        self._ensure_discovered()
+        if key in self._specs:
+            return self._specs[key]
+        for spec in self._specs.values():
+            if spec.display_name == key:
+                return spec
+        raise KeyError(f"Unknown algorithm '{key}', expected one of {list(self._specs)}")
+
+    def filter(self,
+               keys: Sequence[str] = None,
+               parallel: bool = None,
+               stable: bool = None,
+               in_place: bool = None,
+               dtype: str = None) -> List[AlgorithmSpec]:
+        """Specs matching the given keys (or display names) and capabilities."""
+        specs = [self.get(key) for key in keys] if keys is not None else list(self)
+        return [spec for spec in specs if spec.matches(parallel, stable, in_place, dtype)]
+
+    def create(self, key: str, num_processes: int = None, **kwargs) -> Any:
+        return self.get(key).create(num_processes, **kwargs)
+
+    def color_scheme(self) -> Dict[str, str]:
+        """Display name to chart colour, for specs that define one."""
+        return {spec.display_name: spec.color for spec in self if spec.color}
+
+
+registry = AlgorithmRegistry([
+    AlgorithmSpec('merge_sort', 'Merge Sort', '.merge_sort:MergeSort',
+                  stable=True, color='#1f77b4'),
+    AlgorithmSpec('quick_sort', 'Quick Sort', '.quick_sort:QuickSort',
+                  in_place=True, color='#ff7f0e'),
+    AlgorithmSpec('parallel_merge_sort', 'Parallel Merge Sort',
+                  '.parallel.parallel_merge:ParallelMergeSort',
+                  parallel=True, stable=True, budget_aware=True, color='#2ca02c'),
+    AlgorithmSpec('parallel_quick_sort', 'Parallel Quick Sort',
+                  '.parallel.parallel_quick:ParallelQuickSort',
+                  parallel=True, budget_aware=True, color='#d62728'),
+    AlgorithmSpec('parallel_bitonic_sort', 'Parallel Bitonic Sort',
+                  '.parallel.parallel_bitonic:ParallelBitonicSort',
+                  parallel=True, dtypes=('int', 'float'), color='#9467bd'),
+])
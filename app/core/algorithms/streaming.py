@@ -0,0 +1,138 @@
+from typing import List, Dict, Any, Iterable, Iterator
+from concurrent.futures import Future
+import heapq
+import threading
+import time
+from .merge_sort import MergeSort
+from .parallel.ipc import make_executor
+
+def merge_runs(merger: MergeSort, runs: List[List[int]]) -> List[int]:
+    """Merge sorted runs pairwise with MergeSort.merge."""
+    while len(runs) > 1:
+        merged = [merger.merge(runs[i], runs[i + 1]) for i in range(0, len(runs) - 1, 2)]
+        if len(runs) % 2:
+            merged.append(runs[-1])
+        runs = merged
+    return runs[0]
+
+class StreamingSorter:
+    """Incremental sorter for continuously arriving batches.
+
+    Sorted batches land in tier 0 of an LSM-style structure. Whenever a
+    tier holds `fanout` runs they are merged into one run of the next tier
+    on the worker pool, so queries only ever merge a logarithmic number of
+    runs. Ingest blocks while tier 0 already holds `max_pending_runs` runs,
+    which bounds the number of runs (and merge buffers) held besides the
+    data itself.
+    """
+
+    def __init__(self,
+                 fanout: int = 4,
+                 max_pending_runs: int = 16,
+                 num_workers: int = 2,
+                 backend: str = 'thread'):
+        if fanout < 2:
+            raise ValueError("fanout must be at least 2")
+        if max_pending_runs < fanout:
+            raise ValueError("max_pending_runs must be at least fanout")
+
+        self.fanout = fanout
+        self.max_pending_runs = max_pending_runs
+        self.merger = MergeSort()
+        self.tiers: List[List[List[int]]] = [[]]
+        self._in_flight: Dict[int, List[List[int]]] = {}
+        self._error = None
+        self._cond = threading.Condition()
+        self._executor = make_executor(num_workers, backend=backend)
+
+        self.items_ingested = 0
+        self.batches_ingested = 0
+        self.ingest_time = 0.0
+        self.compactions = 0
+
+    def __enter__(self) -> 'StreamingSorter':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _schedule_compactions(self) -> None:
+        # Caller holds self._cond
+        for tier, runs in enumerate(self.tiers):
+            if len(runs) >= self.fanout and tier not in self._in_flight:
+                batch, self.tiers[tier] = runs[:self.fanout], runs[self.fanout:]
+                self._in_flight[tier] = batch
+                future = self._executor.submit(merge_runs, self.merger, batch)
+                future.add_done_callback(
+                    lambda done, tier=tier: self._install(tier, done)
+                )
+
+    def _install(self, tier: int, future: Future) -> None:
+        with self._cond:
+            batch = self._in_flight.pop(tier)
+            if future.exception() is not None:
+                # Keep the data queryable and surface the failure on next ingest
+                self._error = future.exception()
+                self.tiers[tier] = batch + self.tiers[tier]
+            else:
+                if tier + 1 == len(self.tiers):
+                    self.tiers.append([])
+                self.tiers[tier + 1].append(future.result())
+                self.compactions += 1
+                self._schedule_compactions()
+            self._cond.notify_all()
+
+    def ingest(self, batch: Iterable[int]) -> None:
+        """Add a batch; blocks while too many uncompacted runs are pending."""
+        start = time.perf_counter()
+        run = self.merger.sort(list(batch))
+
+        with self._cond:
+            if self._error is not None:
+                error, self._error = self._error, None
+                raise RuntimeError("Background compaction failed") from error
+
+            self._cond.wait_for(lambda: len(self.tiers[0]) < self.max_pending_runs)
+            if run:
+                self.tiers[0].append(run)
+            self.items_ingested += len(run)
+            self.batches_ingested += 1
+            self._schedule_compactions()
+
+        self.ingest_time += time.perf_counter() - start
+
+    def _snapshot(self) -> List[List[int]]:
+        # Runs are never mutated once published, so a shallow copy is a stable view
+        with self._cond:
+            runs = [run for tier in self.tiers for run in tier]
+            runs.extend(run for batch in self._in_flight.values() for run in batch)
+        return runs
+
+    def iter_sorted(self) -> Iterator[int]:
+        """Lazily yield every ingested item in sorted order."""
+        return heapq.merge(*self._snapshot())
+
+    def flush(self) -> None:
+        """Wait until no compaction is running."""
+        with self._cond:
+            self._cond.wait_for(lambda: not self._in_flight)
+
+    def close(self) -> None:
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return ingest and structure metrics."""
+        with self._cond:
+            runs = sum(len(tier) for tier in self.tiers) + sum(
+                len(batch) for batch in self._in_flight.values()
+            )
+            tiers = len(self.tiers)
+        return {
+            'items_ingested': self.items_ingested,
+            'batches_ingested': self.batches_ingested,
+            'ingest_throughput': self.items_ingested / self.ingest_time if self.ingest_time > 0 else 0.0,
+            'compactions': self.compactions,
+            'runs': runs,
+            'tiers': tiers,
+        }
@@ -4,7 +4,20 @@ Parallel Sorting Implementations
 Contains parallel implementations of sorting algorithms.
 """
 
-from ..algorithms.parallel.parallel_merge import ParallelMergeSort
-from ..algorithms.parallel.parallel_quick import ParallelQuickSort
+import importlib
 
-__all__ = ['ParallelMergeSort', 'ParallelQuickSort']
\ No newline at end of file
+_LAZY_IMPORTS = {
+    'ParallelMergeSort': '..algorithms.parallel.parallel_merge',
+    'ParallelQuickSort': '..algorithms.parallel.parallel_quick',
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ['ParallelMergeSort', 'ParallelQuickSort']
@@ -0,0 +1,102 @@
+"""
+Benchmark Checkpoints
+-------------------
+Append-only JSONL store of completed benchmark cells, keyed by a hash of
+everything that determines the cell's result, so interrupted sweeps can
+resume without repeating finished work.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Any, Union
+import numpy as np
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Run parameters that change a cell's result and therefore its hash
+CELL_PARAMS = (
+    'memory_budget_mb', 'profile_ipc', 'isolation', 'warm_runs', 'flush_cache_mb',
+    'selection_k', 'quantiles', 'distributed_workers', 'distributed_nodes',
+)
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (set, tuple, np.ndarray)):
+        return list(value)
+    if isinstance(value, Path):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def config_hash(config: Dict[str, Any]) -> str:
+    """Stable hash of a cell configuration."""
+    encoded = json.dumps(config, sort_keys=True, default=_to_json)
+    return hashlib.sha256(encoded.encode()).hexdigest()[:16]
+
+
+def dataset_fingerprint(data: List[int]) -> str:
+    """Hash of the input values, so regenerated datasets still match."""
+    return hashlib.sha256(np.asarray(data).tobytes()).hexdigest()[:16]
+
+
+class BenchmarkCheckpoint:
+    """Completed cell rows by config hash, persisted one line per cell."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.completed: Dict[str, Dict[str, Any]] = self.load()
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        completed = {}
+        if not self.path.exists():
+            return completed
+        self._truncate_partial_line()
+        with open(self.path) as f:
+            for line_number, line in enumerate(f, 1):
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning("Ignoring corrupt checkpoint line %d in %s", line_number, self.path)
+                    continue
+                completed[entry['config_hash']] = entry['row']
+        return completed
+
+    def _truncate_partial_line(self) -> None:
+        """Cut a partial last line left by a crash mid-write; that cell reruns.
+
+        Otherwise the next record would be appended onto it and lost too.
+        """
+        with open(self.path, 'rb+') as f:
+            content = f.read()
+            if content and not content.endswith(b'\n'):
+                logger.warning("Dropping partial last line of checkpoint %s", self.path)
+                f.truncate(content.rfind(b'\n') + 1)
+
+    def __contains__(self, cell_hash: str) -> bool:
+        return cell_hash in self.completed
+
+    def __len__(self) -> int:
+        return len(self.completed)
+
+    def get(self, cell_hash: str) -> Dict[str, Any]:
+        return self.completed[cell_hash]
+
+    def record(self, cell_hash: str, config: Dict[str, Any], row: Dict[str, Any]) -> None:
+        """Append a finished cell and flush it to disk before returning."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        line = json.dumps({'config_hash': cell_hash, 'config': config, 'row': row}, default=_to_json)
+        with open(self.path, 'a') as f:
+            f.write(line + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self.completed[cell_hash] = row
+
+    def clear(self) -> None:
+        self.completed = {}
+        if self.path.exists():
+            self.path.unlink()
@@ -1,43 +1,366 @@
-from typing import Dict, List, Any
+from operator import itemgetter
+from typing import Dict, List, Any, Callable, Tuple
 import pandas as pd
 import time
 import numpy as np
+import psutil
+from ..algorithms.parallel.ipc import IPCProfiler
+from ..algorithms.base import BaseSortingAlgorithm
+from ..algorithms.registry import registry
+from ..data.generator import DataGenerator
+from ..utils.affinity import resolve_cores
+from ..utils.logging import get_logger
+from ..export import export_results
+from .monitor import ResourceMonitor
+from .isolation import IsolatedTrialRunner, flush_caches
+from .checkpoint import CELL_PARAMS, BenchmarkCheckpoint, config_hash, dataset_fingerprint
+
+logger = get_logger(__name__)
 
 class BenchmarkEngine:
-    def __init__(self):
-        self.algorithms = {
-            'Merge Sort': self._mock_sort,
-            'Quick Sort': self._mock_sort,
-            'Parallel Merge Sort': self._mock_sort,
-            'Parallel Quick Sort': self._mock_sort
+    def __init__(self, num_processes: int = None):
+        self.num_processes = num_processes
+        # Instances by display name, created the first time they are selected
+        self.algorithms: Dict[str, BaseSortingAlgorithm] = {}
+        self.selection = None
+        self.distributed = None
+        # Utilization timelines keyed by (algorithm, input size, trial)
+        self.resource_timelines: Dict[Tuple[str, int, int], List[Dict[str, Any]]] = {}
+
+    def get_algorithms(self, params: Dict[str, Any] = None) -> Dict[str, BaseSortingAlgorithm]:
+        """Instantiate the registered algorithms selected by params.
+
+        `algorithms` lists registry keys or display names (default: all) and
+        `algorithm_filter` holds capability filters (parallel, stable,
+        in_place, dtype). Only the matching implementations are imported.
+        """
+        params = params or {}
+        specs = registry.filter(params.get('algorithms'), **params.get('algorithm_filter', {}))
+        selected = {}
+        for spec in specs:
+            if spec.display_name not in self.algorithms:
+                self.algorithms[spec.display_name] = spec.create(self.num_processes)
+            selected[spec.display_name] = self.algorithms[spec.display_name]
+        return selected
+
+    def _benchmark_cases(self, params: Dict[str, Any]) -> Dict[str, Tuple[str, BaseSortingAlgorithm, Callable]]:
+        """Map each benchmark name to its task type, algorithm and runner."""
+        cases = {
+            name: ('sort', algorithm, algorithm.sort)
+            for name, algorithm in self.get_algorithms(params).items()
         }
 
-    def _mock_sort(self, data: List[int]) -> List[int]:
-        """Mock sorting function for initial testing"""
-        time.sleep(np.random.uniform(0.1, 0.5))  # Simulate processing time
-        return sorted(data)
+        # Distributed sort runs when nodes or worker addresses are configured
+        workers = params.get('distributed_workers')
+        num_nodes = params.get('distributed_nodes')
+        if workers or num_nodes:
+            if self.distributed is None:
+                from ..algorithms.distributed.coordinator import DistributedSampleSort
+                self.distributed = DistributedSampleSort(workers, num_nodes or 2)
+            cases['Distributed Sample Sort'] = ('sort', self.distributed, self.distributed.sort)
+
+        # Selection runs alongside the full sorts when a k is configured
+        k = params.get('selection_k')
+        if k:
+            if self.selection is None:
+                from ..algorithms.parallel.parallel_select import ParallelSelect
+                self.selection = ParallelSelect(self.num_processes)
+            quantiles = params.get('quantiles', [0.25, 0.5, 0.75, 0.99])
+            cases.update({
+                'Top-K Selection': ('select', self.selection,
+                                    lambda data: self.selection.top_k(data, k)),
+                'Nth Element Selection': ('select', self.selection,
+                                          lambda data: self.selection.nth_element(data, len(data) // 2)),
+                'Quantile Selection': ('select', self.selection,
+                                       lambda data: self.selection.select_quantiles(data, quantiles)),
+            })
+        return cases
+
+    @staticmethod
+    def _case_backends(algorithm: BaseSortingAlgorithm, params: Dict[str, Any]) -> List[str]:
+        """Backends a case runs on; executor-based algorithms sweep them."""
+        if hasattr(algorithm, 'backend'):
+            return params.get('backends') or [algorithm.backend]
+        return [getattr(algorithm, 'transport', 'sequential')]
+
+    def plan_matrix(self,
+                    datasets: Dict[int, List[int]],
+                    params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """List every (algorithm, backend, input size, trial) cell with its config hash."""
+        cpu_affinity = resolve_cores(params.get('cpu_affinity'), params.get('cpu_sockets')) or None
+        shared = {name: params.get(name) for name in CELL_PARAMS}
+        cases = self._benchmark_cases(params)
+        cells = []
+        for size, data in datasets.items():
+            fingerprint = dataset_fingerprint(data)
+            for algo_name, (task, algorithm, _) in cases.items():
+                for backend in self._case_backends(algorithm, params):
+                    for trial in range(1, params.get('num_trials', 3) + 1):
+                        config = {
+                            'algorithm': algo_name,
+                            'backend': backend,
+                            'task': task,
+                            'input_size': size,
+                            'trial': trial,
+                            'dataset': fingerprint,
+                            'num_processes': getattr(algorithm, 'num_processes', None),
+                            'cpu_affinity': cpu_affinity,
+                            **shared
+                        }
+                        cells.append({**config, 'config_hash': config_hash(config)})
+        return cells
 
     def run_benchmarks(self, 
                       datasets: Dict[int, List[int]], 
                       params: Dict[str, Any]) -> pd.DataFrame:
         """Run benchmarks and return results DataFrame."""
         results = []
+        profile_ipc = params.get('profile_ipc', False)
+        monitor_resources = params.get('monitor_resources', True)
+        cpu_affinity = resolve_cores(params.get('cpu_affinity'), params.get('cpu_sockets')) or None
+        memory_budget_mb = params.get('memory_budget_mb')
+        flush_cache_mb = params.get('flush_cache_mb', 0)
+        self.resource_timelines = {}
+
+        # Isolation runs each sort trial in a fresh process: True for a
+        # forkserver, or a multiprocessing start method name
+        isolation = params.get('isolation')
+        runner = None
+        if isolation:
+            runner = IsolatedTrialRunner(
+                start_method=isolation if isinstance(isolation, str) else 'forkserver',
+                warm_runs=params.get('warm_runs', 3),
+                flush_cache_mb=flush_cache_mb,
+                timeout=params.get('trial_timeout')
+            )
         
+        # Completed cells are skipped when a checkpoint is given (path or store)
+        checkpoint = params.get('checkpoint')
+        if checkpoint is not None and not isinstance(checkpoint, BenchmarkCheckpoint):
+            checkpoint = BenchmarkCheckpoint(checkpoint)
+        plan = {
+            (cell['algorithm'], cell['backend'], cell['input_size'], cell['trial']): cell
+            for cell in self.plan_matrix(datasets, params)
+        }
+        if checkpoint is not None:
+            done = sum(cell['config_hash'] in checkpoint for cell in plan.values())
+            logger.info("Checkpoint %s: %d of %d cells already complete", checkpoint.path, done, len(plan))
+
         for size, data in datasets.items():
-            for algo_name in self.algorithms:
-                # Run multiple trials
-                for trial in range(params.get('num_trials', 3)):
-                    start_time = time.perf_counter()
-                    sorted_data = self.algorithms[algo_name](data.copy())
-                    end_time = time.perf_counter()
-                    
-                    results.append({
-                        'algorithm': algo_name,
-                        'input_size': size,
-                        'execution_time': end_time - start_time,
-                        'trial': trial + 1,
-                        'memory_usage': np.random.uniform(50, 200),  # Mock memory usage
-                        'is_parallel': 'Parallel' in algo_name
-                    })
+            for algo_name, (task, algorithm, run) in self._benchmark_cases(params).items():
+                # Executor-based algorithms are swept across the requested backends
+                sweep = hasattr(algorithm, 'backend')
+                if sweep:
+                    default_backend = algorithm.backend
+                    default_affinity = algorithm.cpu_affinity
+                backends = self._case_backends(algorithm, params)
+
+                # Only algorithms with a bounded-memory strategy take the budget
+                budget_aware = algo_name in self.algorithms and registry.get(algo_name).budget_aware
+                default_budget = algorithm.memory_budget_mb
+                if memory_budget_mb is not None and budget_aware:
+                    algorithm.memory_budget_mb = memory_budget_mb
+
+                for backend in backends:
+                    if sweep:
+                        algorithm.backend = backend
+                        algorithm.cpu_affinity = cpu_affinity or default_affinity
+                    label = f"{algo_name} [{backend}]" if len(backends) > 1 else algo_name
+
+                    # Attach a profiler to the executor boundaries if requested
+                    profiler = IPCProfiler() if profile_ipc and algorithm.is_parallel else None
+                    algorithm.profiler = profiler
+
+                    # Run multiple trials
+                    isolate = runner is not None and task == 'sort' and algo_name in self.algorithms
+                    for trial in range(params.get('num_trials', 3)):
+                        cell = plan[(algo_name, backend, size, trial + 1)]
+                        if checkpoint is not None and cell['config_hash'] in checkpoint:
+                            results.append(checkpoint.get(cell['config_hash']))
+                            continue
+
+                        if profiler is not None:
+                            profiler.reset()
+                        algorithm.last_run_stats = {}
+
+                        if isolate:
+                            # The algorithm is pickled, without its profiler, into a fresh process
+                            isolated = runner.run(algorithm, data, profile_ipc)
+                            elapsed = isolated['cold_time']
+                            resources = {
+                                'peak_rss_mb': isolated['peak_rss_mb'],
+                                'memory_delta_mb': isolated['memory_delta_mb'],
+                            }
+                            algorithm.last_run_stats = isolated['last_run_stats']
+                            ipc = isolated['ipc']
+                            trial_stats = {'isolation': runner.start_method, **runner.summarize(isolated)}
+                        else:
+                            trial_data = data.copy()
+                            flush_caches(flush_cache_mb)
+                            monitor = None
+                            if monitor_resources:
+                                monitor = ResourceMonitor(params.get('monitor_interval', 0.05))
+                                monitor.start()
+
+                            start_time = time.perf_counter()
+                            run(trial_data)
+                            elapsed = time.perf_counter() - start_time
+
+                            resources = {}
+                            if monitor is not None:
+                                monitor.stop()
+                                self.resource_timelines[(label, size, trial + 1)] = monitor.timeline
+                                resources = monitor.summary()
+                                # Per-core detail stays in the timeline, peak RSS becomes memory_usage
+                                resources.pop('per_core_utilization')
+                            ipc = profiler.summary() if profiler is not None else {}
+                            trial_stats = {}
+
+                        row = {
+                            'algorithm': label,
+                            'implementation': algo_name,
+                            'backend': backend,
+                            'task': task,
+                            'input_size': size,
+                            'execution_time': elapsed,
+                            'trial': trial + 1,
+                            'memory_usage': resources.pop(
+                                'peak_rss_mb', psutil.Process().memory_info().rss / 1024 / 1024
+                            ),
+                            'is_parallel': algorithm.is_parallel,
+                            'cpu_affinity': ','.join(map(str, getattr(algorithm, 'cpu_affinity', None) or [])) or None
+                        }
+                        row.update(resources)
+                        if budget_aware and algorithm.memory_budget_mb is not None:
+                            row['memory_budget_mb'] = algorithm.memory_budget_mb
+                            # None when the growth was not measured or cannot be trusted
+                            memory_delta_mb = resources.get('memory_delta_mb')
+                            row['within_budget'] = (
+                                memory_delta_mb <= algorithm.memory_budget_mb
+                                if memory_delta_mb is not None else None
+                            )
+                        row.update(algorithm.last_run_stats)
+                        row.update(ipc)
+                        row.update(trial_stats)
+                        row['config_hash'] = cell['config_hash']
+                        if checkpoint is not None:
+                            config = {k: v for k, v in cell.items() if k != 'config_hash'}
+                            checkpoint.record(cell['config_hash'], config, row)
+                        results.append(row)
+
+                    algorithm.profiler = None
+
+                algorithm.memory_budget_mb = default_budget
+                if sweep:
+                    algorithm.backend = default_backend
+                    algorithm.cpu_affinity = default_affinity
         
-        return pd.DataFrame(results)
\ No newline at end of file
+        return pd.DataFrame(results)
+
+    def run_record_benchmarks(self,
+                              sizes: List[int],
+                              widths: List[int],
+                              params: Dict[str, Any]) -> pd.DataFrame:
+        """Compare key/argsort sorting against full-record sorting by record width."""
+        results = []
+        generator = DataGenerator()
+        key = itemgetter(0)
+
+        for size in sizes:
+            for width in widths:
+                records = generator.generate_records(
+                    size, width, params.get('random_seed', 42)
+                )
+                for algo_name, algorithm in self.get_algorithms(params).items():
+                    modes = {
+                        'full_record': lambda: algorithm.sort(list(records)),
+                        'key_argsort': lambda: algorithm.sort_by_key(records, key),
+                    }
+                    # Numeric-only algorithms such as bitonic only rank the keys
+                    if 'record' not in registry.get(algo_name).dtypes:
+                        del modes['full_record']
+                    for mode, run in modes.items():
+                        for trial in range(params.get('num_trials', 3)):
+                            start_time = time.perf_counter()
+                            run()
+                            elapsed = time.perf_counter() - start_time
+
+                            results.append({
+                                'algorithm': algo_name,
+                                'mode': mode,
+                                'input_size': size,
+                                'record_width': width,
+                                'execution_time': elapsed,
+                                'throughput': size / elapsed if elapsed > 0 else 0.0,
+                                'trial': trial + 1,
+                                'is_parallel': algorithm.is_parallel
+                            })
+
+        return pd.DataFrame(results)
+
+    def run_streaming_benchmarks(self,
+                                 datasets: Dict[int, List[int]],
+                                 params: Dict[str, Any]) -> pd.DataFrame:
+        """Measure ingest throughput and query latency of the streaming sorter."""
+        from ..algorithms.streaming import StreamingSorter
+        results = []
+        batch_size = params.get('batch_size', 1000)
+        query_every = params.get('query_every', 10)
+
+        for size, data in datasets.items():
+            for trial in range(params.get('num_trials', 3)):
+                latencies = []
+                with StreamingSorter(
+                    fanout=params.get('fanout', 4),
+                    max_pending_runs=params.get('max_pending_runs', 16),
+                    num_workers=params.get('num_processes', 2),
+                    backend=params.get('streaming_backend', 'thread')
+                ) as sorter:
+                    for i, start in enumerate(range(0, len(data), batch_size)):
+                        sorter.ingest(data[start:start + batch_size])
+
+                        # Query latency is the time to the first item of the sorted view
+                        if i % query_every == 0:
+                            query_start = time.perf_counter()
+                            next(sorter.iter_sorted(), None)
+                            latencies.append(time.perf_counter() - query_start)
+
+                    scan_start = time.perf_counter()
+                    for _ in sorter.iter_sorted():
+                        pass
+                    scan_time = time.perf_counter() - scan_start
+                    metrics = sorter.get_metrics()
+
+                results.append({
+                    'algorithm': 'Streaming Sort',
+                    'input_size': size,
+                    'batch_size': batch_size,
+                    'trial': trial + 1,
+                    'execution_time': sorter.ingest_time,
+                    'ingest_throughput': metrics['ingest_throughput'],
+                    'mean_query_latency': float(np.mean(latencies)) if latencies else 0.0,
+                    'max_query_latency': max(latencies, default=0.0),
+                    'full_scan_time': scan_time,
+                    'compactions': metrics['compactions'],
+                    'runs': metrics['runs']
+                })
+
+        return pd.DataFrame(results)
+
+    def export_results(self,
+                       results: pd.DataFrame,
+                       destination,
+                       fmt: str = 'ndjson',
+                       chunk_rows: int = 10_000) -> None:
+        """Write benchmark results to a path or binary file in chunks.
+
+        Supports 'ndjson' and 'csv', plus 'parquet' and 'arrow' when pyarrow
+        is installed.
+        """
+        export_results(results, destination, fmt, chunk_rows)
+
+    def close(self) -> None:
+        """Stop the localhost cluster started for the distributed sort, if any."""
+        if self.distributed is not None:
+            self.distributed.close()
+            self.distributed = None
@@ -0,0 +1,140 @@
+"""
+Trial Isolation
+-------------
+Runs each benchmark trial in a fresh interpreter so allocator state, warm
+caches and leftover worker pools from earlier trials cannot leak into it.
+The first run in the child is the cold-start timing; the runs after it are
+the warm steady state.
+"""
+
+import multiprocessing
+import statistics
+import time
+import traceback
+from typing import Dict, List, Any
+import numpy as np
+from ..algorithms.base import BaseSortingAlgorithm
+from ..algorithms.parallel.ipc import IPCProfiler
+from .monitor import ResourceMonitor
+
+
+def flush_caches(size_mb: int) -> None:
+    """Write and read a buffer larger than the last-level cache to evict it."""
+    if size_mb <= 0:
+        return
+    buffer = np.ones(size_mb * 1024 * 1024 // 8)
+    buffer += 1.0
+    buffer.sum()
+
+
+def run_trial(algorithm: BaseSortingAlgorithm,
+              data: List[int],
+              warm_runs: int = 3,
+              flush_cache_mb: int = 0,
+              profile_ipc: bool = False) -> Dict[str, Any]:
+    """Time one cold run followed by `warm_runs` warm runs of algorithm.sort."""
+    profiler = IPCProfiler() if profile_ipc and algorithm.is_parallel else None
+    algorithm.profiler = profiler
+    algorithm.last_run_stats = {}
+
+    flush_caches(flush_cache_mb)
+    trial_data = data.copy()
+    # Memory growth of the cold run, None when it started worker processes
+    with ResourceMonitor() as monitor:
+        start_time = time.perf_counter()
+        algorithm.sort(trial_data)
+        cold_time = time.perf_counter() - start_time
+    resources = monitor.summary()
+    last_run_stats = dict(algorithm.last_run_stats)
+    ipc = profiler.summary() if profiler is not None else {}
+
+    # Warm runs reuse this interpreter's imports, allocator and caches
+    algorithm.profiler = None
+    warm_times = []
+    for _ in range(warm_runs):
+        start_time = time.perf_counter()
+        algorithm.sort(data.copy())
+        warm_times.append(time.perf_counter() - start_time)
+
+    return {
+        'cold_time': cold_time,
+        'warm_times': warm_times,
+        # Sampled by the monitor, so it also works where `resource` is missing
+        'peak_rss_mb': resources.get('peak_rss_mb'),
+        'memory_delta_mb': resources.get('memory_delta_mb'),
+        'last_run_stats': last_run_stats,
+        'ipc': ipc,
+    }
+
+
+def _trial_process(conn, pool_start_method: str, *args) -> None:
+    # A forkserver/spawn child inherits its own start method as the default,
+    # which would make every worker pool the algorithm opens start a new
+    # forkserver. Pools use the parent's method so timings stay comparable.
+    multiprocessing.set_start_method(pool_start_method, force=True)
+    try:
+        conn.send(('ok', run_trial(*args)))
+    except BaseException:
+        conn.send(('error', traceback.format_exc()))
+    finally:
+        conn.close()
+
+
+class IsolatedTrialRunner:
+    """Runs every trial in a new process from the given start method."""
+
+    def __init__(self,
+                 start_method: str = 'forkserver',
+                 warm_runs: int = 3,
+                 flush_cache_mb: int = 0,
+                 timeout: float = None):
+        if start_method not in multiprocessing.get_all_start_methods():
+            start_method = 'spawn'
+        self.start_method = start_method
+        self.context = multiprocessing.get_context(start_method)
+        self.warm_runs = warm_runs
+        self.flush_cache_mb = flush_cache_mb
+        self.timeout = timeout
+
+    def run(self,
+            algorithm: BaseSortingAlgorithm,
+            data: List[int],
+            profile_ipc: bool = False) -> Dict[str, Any]:
+        """Run one isolated trial and return cold and warm timings."""
+        receiver, sender = self.context.Pipe(duplex=False)
+        # None leaves the child on the platform default, as in the parent
+        pool_start_method = multiprocessing.get_start_method(allow_none=True)
+        process = self.context.Process(
+            target=_trial_process,
+            args=(sender, pool_start_method, algorithm, data,
+                  self.warm_runs, self.flush_cache_mb, profile_ipc)
+        )
+        process.start()
+        sender.close()
+        try:
+            if not receiver.poll(self.timeout):
+                process.kill()
+                raise TimeoutError(f"Isolated trial exceeded {self.timeout}s")
+            status, payload = receiver.recv()
+        except EOFError:
+            raise RuntimeError(f"Isolated trial process exited with code {process.exitcode}")
+        finally:
+            receiver.close()
+            process.join()
+
+        if status == 'error':
+            raise RuntimeError(f"Isolated trial failed:\n{payload}")
+        return payload
+
+    @staticmethod
+    def summarize(trial: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten a trial result into benchmark row columns."""
+        warm_times = trial['warm_times']
+        warm_time = statistics.median(warm_times) if warm_times else None
+        return {
+            'cold_time': trial['cold_time'],
+            'warm_time': warm_time,
+            'warm_time_std': statistics.stdev(warm_times) if len(warm_times) > 1 else 0.0,
+            'warm_runs': len(warm_times),
+            'cold_penalty': trial['cold_time'] / warm_time if warm_time else None,
+        }
@@ -1,6 +1,7 @@
 from typing import List, Dict, Any
 import psutil
 import numpy as np
+import pandas as pd
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -10,9 +11,13 @@ def calculate_metrics(
     sorted_data: List[int],
     execution_time: float,
     algorithm_name: str,
-    input_size: int
+    input_size: int,
+    resource_summary: Dict[str, Any] = None
 ) -> Dict[str, Any]:
-    """Calculate comprehensive performance metrics for a sorting run."""
+    """Calculate comprehensive performance metrics for a sorting run.
+
+    Pass the ResourceMonitor summary of the run to report utilization
+    measured during the sort rather than after it."""
     try:
         metrics = {
             'algorithm': algorithm_name,
@@ -23,10 +28,15 @@ def calculate_metrics(
             'stability_score': calculate_stability_score(original_data, sorted_data),
         }
         
+        if resource_summary:
+            metrics['memory_usage'] = resource_summary['peak_rss_mb']
+
         # Calculate additional metrics for parallel algorithms
         if 'parallel' in algorithm_name.lower():
+            # Utilization is only meaningful when sampled during the run
+            if resource_summary:
+                metrics['cpu_utilization'] = resource_summary['cpu_utilization']
             metrics.update({
-                'cpu_utilization': psutil.cpu_percent(interval=0.1),
                 'num_cpu_cores': psutil.cpu_count(),
                 'parallel_efficiency': calculate_parallel_efficiency(
                     execution_time,
@@ -111,4 +121,38 @@ def aggregate_metrics(metrics_list: List[Dict[str, Any]]) -> Dict[str, Any]:
             'mean_cpu_utilization': df['cpu_utilization'].mean()
         })
     
-    return aggregated
\ No newline at end of file
+    return aggregated
+
+def aggregate_ipc_metrics(results: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate IPC profiling columns per algorithm and input size."""
+    ipc_columns = [c for c in results.columns if c.startswith('ipc_')]
+    if not ipc_columns:
+        return pd.DataFrame()
+
+    profiled = results.dropna(subset=['ipc_tasks'])
+    aggregated = profiled.groupby(['algorithm', 'input_size'])[ipc_columns].mean()
+
+    # Share of the wall-clock run spent moving data across the boundary
+    communication = (
+        aggregated['ipc_serialize_time']
+        + aggregated['ipc_deserialize_time']
+        + aggregated['ipc_queue_wait']
+    )
+    execution_time = profiled.groupby(['algorithm', 'input_size'])['execution_time'].mean()
+    aggregated['ipc_wall_fraction'] = (communication / execution_time).clip(upper=1.0)
+
+    return aggregated.reset_index()
+
+
+def select_fastest_backend(results: pd.DataFrame) -> pd.DataFrame:
+    """Pick the backend with the lowest mean time per implementation and input size."""
+    parallel = results[results['backend'] != 'sequential']
+    mean_times = (
+        parallel.groupby(['implementation', 'input_size', 'backend'])['execution_time']
+        .mean()
+        .reset_index()
+    )
+    fastest = mean_times.loc[
+        mean_times.groupby(['implementation', 'input_size'])['execution_time'].idxmin()
+    ]
+    return fastest.reset_index(drop=True)
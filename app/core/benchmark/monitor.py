@@ -0,0 +1,158 @@
+from typing import Dict, List, Any, Optional, Tuple
+import threading
+import time
+import psutil
+import numpy as np
+
+class ResourceMonitor:
+    """Samples per-core CPU, context switches and RSS in a background thread.
+
+    Use as a context manager around a single trial; worker processes spawned
+    during the trial are included through the process tree.
+
+    Memory growth is tracked per process as unique set size (USS), so pages a
+    forked worker still shares copy-on-write with its parent are not counted.
+    A worker first seen mid-trial may already have allocated before its first
+    sample, so growth is only reported when no process appeared after start.
+    """
+
+    def __init__(self, interval: float = 0.05, include_children: bool = True):
+        self.interval = interval
+        self.include_children = include_children
+        self.timeline: List[Dict[str, Any]] = []
+        self._process = psutil.Process()
+        self._stop = threading.Event()
+        self._thread = None
+        self._start_time = 0.0
+        self._baseline: Dict[int, Tuple[int, int]] = {}
+        self._latest: Dict[int, Tuple[int, int]] = {}
+        # Footprint of each process when first seen, and its largest since
+        self._footprint_base: Dict[int, int] = {}
+        self._footprint_peak: Dict[int, int] = {}
+        self._initial_pids = set()
+
+    def __enter__(self) -> 'ResourceMonitor':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def _processes(self) -> List[psutil.Process]:
+        processes = [self._process]
+        if self.include_children:
+            try:
+                processes.extend(self._process.children(recursive=True))
+            except psutil.Error:
+                pass
+        return processes
+
+    def _ctx_switches(self, processes: List[psutil.Process]) -> Dict[int, Tuple[int, int]]:
+        switches = {}
+        for process in processes:
+            try:
+                counts = process.num_ctx_switches()
+                switches[process.pid] = (counts.voluntary, counts.involuntary)
+            except psutil.Error:
+                continue  # Worker exited between listing and sampling
+        return switches
+
+    def _rss_mb(self, processes: List[psutil.Process]) -> float:
+        rss = 0
+        for process in processes:
+            try:
+                rss += process.memory_info().rss
+            except psutil.Error:
+                continue
+        return rss / 1024 / 1024
+
+    @staticmethod
+    def _footprint(process: psutil.Process) -> int:
+        try:
+            return process.memory_full_info().uss
+        except psutil.AccessDenied:
+            return process.memory_info().rss
+
+    def _track_footprints(self, processes: List[psutil.Process]) -> None:
+        for process in processes:
+            try:
+                footprint = self._footprint(process)
+            except psutil.Error:
+                continue
+            self._footprint_base.setdefault(process.pid, footprint)
+            self._footprint_peak[process.pid] = max(self._footprint_peak.get(process.pid, 0), footprint)
+
+    def memory_delta_mb(self) -> Optional[float]:
+        """Sampled memory growth of the trial, or None if it cannot be trusted."""
+        if not self._footprint_base or set(self._footprint_base) - self._initial_pids:
+            return None
+        growth = sum(max(0, self._footprint_peak[pid] - base) for pid, base in self._footprint_base.items())
+        return growth / 1024 / 1024
+
+    def _sample(self) -> None:
+        processes = self._processes()
+        rss_mb = self._rss_mb(processes)
+        self._track_footprints(processes)
+        self._latest.update(self._ctx_switches(processes))
+        voluntary, involuntary = self._ctx_switch_deltas()
+        self.timeline.append({
+            'time': time.perf_counter() - self._start_time,
+            'per_core': psutil.cpu_percent(percpu=True),
+            'rss_mb': rss_mb,
+            'voluntary_ctx_switches': voluntary,
+            'involuntary_ctx_switches': involuntary,
+        })
+
+    def _ctx_switch_deltas(self) -> Tuple[int, int]:
+        voluntary = involuntary = 0
+        for pid, (vol, invol) in self._latest.items():
+            base_vol, base_invol = self._baseline.get(pid, (0, 0))
+            voluntary += vol - base_vol
+            involuntary += invol - base_invol
+        return voluntary, involuntary
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self) -> None:
+        self.timeline = []
+        self._stop.clear()
+        processes = self._processes()
+        self._baseline = self._ctx_switches(processes)
+        self._latest = dict(self._baseline)
+        self._footprint_base = {}
+        self._footprint_peak = {}
+        self._track_footprints(processes)
+        self._initial_pids = set(self._footprint_base)
+        psutil.cpu_percent(percpu=True)  # Prime the per-core counters
+        self._start_time = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        # Final sample so short trials still get one measurement
+        self._sample()
+
+    def summary(self) -> Dict[str, Any]:
+        """Aggregate the timeline into per-trial metrics."""
+        if not self.timeline:
+            return {}
+
+        per_core = np.array([sample['per_core'] for sample in self.timeline])
+        rss = [sample['rss_mb'] for sample in self.timeline]
+        last = self.timeline[-1]
+        return {
+            'cpu_utilization': float(per_core.mean()),
+            'per_core_utilization': per_core.mean(axis=0).round(1).tolist(),
+            'peak_rss_mb': max(rss),
+            'memory_delta_mb': self.memory_delta_mb(),
+            'mean_rss_mb': float(np.mean(rss)),
+            'voluntary_ctx_switches': last['voluntary_ctx_switches'],
+            'involuntary_ctx_switches': last['involuntary_ctx_switches'],
+            'monitor_samples': len(self.timeline),
+        }
@@ -0,0 +1,295 @@
+"""
+Regression Benchmarks
+-------------------
+Runs a fixed matrix of algorithms x special-case inputs x sizes, stores
+baselines per machine profile and fails when throughput drops
+significantly below the stored baseline.
+
+    python -m core.benchmark.regression --update-baseline
+    python -m core.benchmark.regression --threshold 0.1
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Any, Sequence, Tuple
+import pandas as pd
+import psutil
+from ..algorithms.registry import REGISTRY_VERSION, registry
+from ..data.generator import DataGenerator
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_BASELINE_DIR = Path(__file__).resolve().parents[3] / 'benchmarks' / 'baselines'
+
+
+class BenchmarkRegressionError(Exception):
+    """Raised when throughput regresses past the configured threshold."""
+
+    def __init__(self, comparison: pd.DataFrame):
+        self.comparison = comparison
+        regressed = comparison[comparison['regressed']]
+        lines = [
+            f"  {row.cell}: {row.baseline_mean:,.0f} -> {row.current_mean:,.0f} items/s "
+            f"({row.change:+.1%}, p={row.p_value:.4f})"
+            for row in regressed.itertuples()
+        ]
+        super().__init__(
+            f"{len(regressed)} benchmark cell(s) regressed:\n" + "\n".join(lines)
+        )
+
+
+class BaselineVersionError(Exception):
+    """Raised when a baseline was recorded under a different registry version."""
+
+
+def machine_profile() -> Dict[str, Any]:
+    """Describe the hardware and runtime baselines are valid for."""
+    profile = {
+        'system': platform.system(),
+        'machine': platform.machine(),
+        'processor': platform.processor() or 'unknown',
+        'logical_cores': psutil.cpu_count(logical=True),
+        'physical_cores': psutil.cpu_count(logical=False),
+        'memory_gb': round(psutil.virtual_memory().total / 1024 ** 3),
+        'python': platform.python_version().rsplit('.', 1)[0],
+    }
+    digest = hashlib.sha256(json.dumps(profile, sort_keys=True).encode()).hexdigest()[:12]
+    profile['id'] = f"{profile['system']}-{profile['machine']}-{profile['logical_cores']}c-{digest}".lower()
+    return profile
+
+
+def _betacf(a: float, b: float, x: float) -> float:
+    """Continued fraction for the regularized incomplete beta function."""
+    tiny = 1e-300
+    c, d = 1.0, 1.0 - (a + b) * x / (a + 1.0)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, 200):
+        m2 = 2 * m
+        for numerator in (
+            m * (b - m) * x / ((a + m2 - 1.0) * (a + m2)),
+            -(a + m) * (a + b + m) * x / ((a + m2) * (a + m2 + 1.0)),
+        ):
+            d = 1.0 + numerator * d
+            d = 1.0 / (d if abs(d) > tiny else tiny)
+            c = 1.0 + numerator / c
+            c = c if abs(c) > tiny else tiny
+            h *= d * c
+        if abs(d * c - 1.0) < 1e-12:
+            break
+    return h
+
+
+def _betainc(a: float, b: float, x: float) -> float:
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    front = math.exp(
+        math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+        + a * math.log(x) + b * math.log(1.0 - x)
+    )
+    if x < (a + 1.0) / (a + b + 2.0):
+        return front * _betacf(a, b, x) / a
+    return 1.0 - front * _betacf(b, a, 1.0 - x) / b
+
+
+def welch_t_test(baseline: Sequence[float], current: Sequence[float]) -> Tuple[float, float]:
+    """One-sided Welch's t-test that `current` has a lower mean than `baseline`.
+
+    Returns (t statistic, p-value).
+    """
+    n1, n2 = len(baseline), len(current)
+    if n1 < 2 or n2 < 2:
+        raise ValueError("Welch's t-test needs at least two samples per group")
+
+    mean1, mean2 = sum(baseline) / n1, sum(current) / n2
+    var1 = sum((x - mean1) ** 2 for x in baseline) / (n1 - 1)
+    var2 = sum((x - mean2) ** 2 for x in current) / (n2 - 1)
+    se2 = var1 / n1 + var2 / n2
+    if se2 == 0:
+        # Identical constant samples: significant only if the means differ
+        return (math.inf, 0.0) if mean1 > mean2 else (0.0, 1.0)
+
+    t = (mean1 - mean2) / math.sqrt(se2)
+    df = se2 ** 2 / ((var1 / n1) ** 2 / (n1 - 1) + (var2 / n2) ** 2 / (n2 - 1))
+    # P(T >= t) for Student's t with df degrees of freedom
+    tail = 0.5 * _betainc(df / 2.0, 0.5, df / (df + t * t))
+    return t, tail if t > 0 else 1.0 - tail
+
+
+class RegressionSuite:
+    """Fixed benchmark matrix with stored per-machine baselines."""
+
+    def __init__(self,
+                 algorithms: Sequence[str] = None,
+                 cases: Sequence[str] = None,
+                 sizes: Sequence[int] = (2000, 20000),
+                 trials: int = 5,
+                 num_processes: int = None,
+                 baseline_dir: Path = DEFAULT_BASELINE_DIR,
+                 threshold: float = 0.10,
+                 alpha: float = 0.05):
+        self.generator = DataGenerator()
+        self.algorithms = list(algorithms or registry.keys())
+        self.cases = list(cases or self.generator.special_cases)
+        self.sizes = list(sizes)
+        self.trials = trials
+        self.num_processes = num_processes
+        self.baseline_dir = Path(baseline_dir)
+        self.threshold = threshold
+        self.alpha = alpha
+        self.profile = machine_profile()
+
+    @property
+    def baseline_path(self) -> Path:
+        return self.baseline_dir / f"{self.profile['id']}.json"
+
+    def run(self) -> Dict[str, List[float]]:
+        """Run the matrix and return throughput samples (items/s) per cell."""
+        results = {}
+        for key in self.algorithms:
+            algorithm = registry.create(key, self.num_processes)
+            for case in self.cases:
+                for size in self.sizes:
+                    data = self.generator.generate_special_case(size, case)
+                    expected = sorted(data)
+                    cell = f"{key}|{case}|{size}"
+
+                    # Warm-up run doubles as a correctness check
+                    if algorithm.sort(data.copy()) != expected:
+                        raise AssertionError(f"{cell} produced unsorted output")
+
+                    samples = []
+                    for _ in range(self.trials):
+                        start = time.perf_counter()
+                        algorithm.sort(data.copy())
+                        samples.append(size / (time.perf_counter() - start))
+                    results[cell] = samples
+                    logger.info("%s: %.0f items/s", cell, sum(samples) / len(samples))
+        return results
+
+    def save_baseline(self, results: Dict[str, List[float]]) -> Path:
+        self.baseline_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.baseline_path, 'w') as f:
+            json.dump({
+                'profile': self.profile,
+                'registry_version': REGISTRY_VERSION,
+                'created': datetime.now(timezone.utc).isoformat(),
+                'trials': self.trials,
+                'results': results,
+            }, f, indent=2)
+        return self.baseline_path
+
+    def load_baseline(self) -> Dict[str, List[float]]:
+        if not self.baseline_path.exists():
+            raise FileNotFoundError(
+                f"No baseline for machine profile {self.profile['id']} at {self.baseline_path}; "
+                f"run with --update-baseline first"
+            )
+        with open(self.baseline_path) as f:
+            baseline = json.load(f)
+        # Algorithm keys may have named other implementations in older baselines
+        version = baseline.get('registry_version', 1)
+        if version != REGISTRY_VERSION:
+            raise BaselineVersionError(
+                f"Baseline {self.baseline_path} was recorded with algorithm registry "
+                f"version {version}, current is {REGISTRY_VERSION}; "
+                f"run with --update-baseline to record a new one"
+            )
+        return baseline['results']
+
+    def compare(self,
+                results: Dict[str, List[float]],
+                baseline: Dict[str, List[float]]) -> pd.DataFrame:
+        """Compare throughput per cell; a cell regresses when it is both
+        significantly lower (p < alpha) and lower by more than the threshold."""
+        rows = []
+        for cell, current in results.items():
+            if cell not in baseline:
+                logger.warning("No baseline for %s, skipping", cell)
+                continue
+            base = baseline[cell]
+            baseline_mean = sum(base) / len(base)
+            current_mean = sum(current) / len(current)
+            change = (current_mean - baseline_mean) / baseline_mean
+            _, p_value = welch_t_test(base, current)
+            rows.append({
+                'cell': cell,
+                'baseline_mean': baseline_mean,
+                'current_mean': current_mean,
+                'change': change,
+                'p_value': p_value,
+                'regressed': p_value < self.alpha and change < -self.threshold,
+            })
+        return pd.DataFrame(rows, columns=[
+            'cell', 'baseline_mean', 'current_mean', 'change', 'p_value', 'regressed'
+        ])
+
+    def check(self, results: Dict[str, List[float]] = None) -> pd.DataFrame:
+        """Run (unless results are given) and raise on any regression."""
+        results = results if results is not None else self.run()
+        comparison = self.compare(results, self.load_baseline())
+        if comparison['regressed'].any():
+            raise BenchmarkRegressionError(comparison)
+        return comparison
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Sorting benchmark regression suite")
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="Store this run as the baseline for the machine profile")
+    parser.add_argument('--algorithms', nargs='+', default=None)
+    parser.add_argument('--cases', nargs='+', default=None)
+    parser.add_argument('--sizes', nargs='+', type=int, default=[2000, 20000])
+    parser.add_argument('--trials', type=int, default=5)
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="Relative throughput drop that counts as a regression")
+    parser.add_argument('--alpha', type=float, default=0.05)
+    parser.add_argument('--baseline-dir', type=Path, default=DEFAULT_BASELINE_DIR)
+    args = parser.parse_args(argv)
+    if args.trials < 2:
+        parser.error("--trials must be at least 2 for Welch's t-test")
+
+    suite = RegressionSuite(
+        algorithms=args.algorithms,
+        cases=args.cases,
+        sizes=args.sizes,
+        trials=args.trials,
+        num_processes=args.processes,
+        baseline_dir=args.baseline_dir,
+        threshold=args.threshold,
+        alpha=args.alpha,
+    )
+    results = suite.run()
+
+    if args.update_baseline:
+        print(f"Baseline written to {suite.save_baseline(results)}")
+        return 0
+
+    try:
+        comparison = suite.check(results)
+    except (FileNotFoundError, BaselineVersionError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+    except BenchmarkRegressionError as e:
+        print(e.comparison.to_string(index=False))
+        print(f"\nFAILED: {e}", file=sys.stderr)
+        return 1
+
+    print(comparison.to_string(index=False))
+    print("\nNo throughput regressions")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
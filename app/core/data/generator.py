@@ -1,9 +1,10 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 import numpy as np
 
 class DataGenerator:
     def __init__(self):
         self.supported_distributions = ['uniform', 'normal', 'exponential']
+        self.special_cases = ['random', 'sorted', 'reverse_sorted', 'all_equal', 'nearly_sorted']
 
     def generate_datasets(self, params: Dict[str, Any]) -> Dict[int, List[int]]:
         """Generate test datasets according to configuration parameters."""
@@ -20,6 +21,18 @@ class DataGenerator:
         
         return datasets
 
+    def generate_records(self, size: int, width: int, random_seed: int = 42) -> List[Tuple[int, bytes]]:
+        """Generate (key, payload) records with a payload of `width` bytes."""
+        rng = np.random.default_rng(random_seed)
+        keys = rng.integers(0, size * 10, size=size).tolist()
+        payloads = rng.integers(0, 256, size=(size, width), dtype=np.uint8)
+        return [(key, payloads[i].tobytes()) for i, key in enumerate(keys)]
+
+    def generate_special_case(self, size: int, case_type: str, random_seed: int = 42) -> List[int]:
+        """Generate a reproducible special test case."""
+        np.random.seed(random_seed)
+        return [int(x) for x in self._generate_special_case(size, case_type)]
+
     def _generate_special_case(self, size: int, case_type: str) -> List[int]:
         """Generate special test cases."""
         if case_type == 'sorted':
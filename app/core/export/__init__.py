@@ -0,0 +1,21 @@
+"""
+Results Export Module
+-------------------
+Chunked writers for benchmark results in NDJSON, CSV, Parquet and Arrow.
+"""
+
+from .writers import (
+    EXPORT_FORMATS,
+    available_formats,
+    export_results,
+    iter_csv,
+    iter_ndjson,
+)
+
+__all__ = [
+    'EXPORT_FORMATS',
+    'available_formats',
+    'export_results',
+    'iter_csv',
+    'iter_ndjson',
+]
@@ -0,0 +1,117 @@
+from typing import Dict, Any, BinaryIO, Iterable, Iterator, List, Union
+from pathlib import Path
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Parquet/Arrow export is optional
+    pa = None
+    pq = None
+
+DEFAULT_CHUNK_ROWS = 10_000
+
+Results = Union[pd.DataFrame, Iterable[pd.DataFrame]]
+Destination = Union[str, Path, BinaryIO]
+
+def iter_frames(results: Results, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """Yield results as DataFrame chunks without copying the whole frame."""
+    if isinstance(results, pd.DataFrame):
+        for start in range(0, len(results), chunk_rows):
+            yield results.iloc[start:start + chunk_rows]
+    else:
+        yield from results
+
+def iter_ndjson(results: Results, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[bytes]:
+    """Yield newline-delimited JSON, one encoded chunk at a time."""
+    for frame in iter_frames(results, chunk_rows):
+        if len(frame):
+            text = frame.to_json(orient='records', lines=True)
+            yield (text if text.endswith('\n') else text + '\n').encode('utf-8')
+
+def iter_csv(results: Results, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[bytes]:
+    """Yield CSV with a single header row, one encoded chunk at a time."""
+    header = True
+    for frame in iter_frames(results, chunk_rows):
+        yield frame.to_csv(index=False, header=header).encode('utf-8')
+        header = False
+
+def _write_stream(chunks: Iterator[bytes], destination: Destination) -> None:
+    if isinstance(destination, (str, Path)):
+        with open(destination, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
+    else:
+        for chunk in chunks:
+            destination.write(chunk)
+
+def _require_pyarrow(fmt: str) -> None:
+    if pa is None:
+        raise ImportError(f"{fmt} export requires pyarrow; install it with 'pip install pyarrow'")
+
+def _arrow_batches(results: Results, chunk_rows: int):
+    """Yield (schema, table) pairs, keeping the first chunk's schema for the rest."""
+    schema = pa.Schema.from_pandas(results, preserve_index=False) if isinstance(results, pd.DataFrame) else None
+    for frame in iter_frames(results, chunk_rows):
+        table = pa.Table.from_pandas(frame, schema=schema, preserve_index=False)
+        schema = table.schema
+        yield schema, table
+
+def write_ndjson(results: Results, destination: Destination, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> None:
+    _write_stream(iter_ndjson(results, chunk_rows), destination)
+
+def write_csv(results: Results, destination: Destination, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> None:
+    _write_stream(iter_csv(results, chunk_rows), destination)
+
+def write_parquet(results: Results, destination: Destination, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> None:
+    """Write one Parquet row group per chunk."""
+    _require_pyarrow('Parquet')
+    writer = None
+    try:
+        for schema, table in _arrow_batches(results, chunk_rows):
+            if writer is None:
+                writer = pq.ParquetWriter(destination, schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+def write_arrow(results: Results, destination: Destination, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> None:
+    """Write an Arrow IPC stream, one record batch per chunk."""
+    _require_pyarrow('Arrow')
+    writer = None
+    try:
+        for schema, table in _arrow_batches(results, chunk_rows):
+            if writer is None:
+                writer = pa.ipc.new_stream(destination, schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+EXPORT_FORMATS: Dict[str, Dict[str, Any]] = {
+    'ndjson': {'writer': write_ndjson, 'extension': '.ndjson',
+               'mime': 'application/x-ndjson', 'requires_pyarrow': False},
+    'csv': {'writer': write_csv, 'extension': '.csv',
+            'mime': 'text/csv', 'requires_pyarrow': False},
+    'parquet': {'writer': write_parquet, 'extension': '.parquet',
+                'mime': 'application/vnd.apache.parquet', 'requires_pyarrow': True},
+    'arrow': {'writer': write_arrow, 'extension': '.arrows',
+              'mime': 'application/vnd.apache.arrow.stream', 'requires_pyarrow': True},
+}
+
+def available_formats() -> List[str]:
+    """Formats usable in this environment."""
+    return [
+        name for name, spec in EXPORT_FORMATS.items()
+        if pa is not None or not spec['requires_pyarrow']
+    ]
+
+def export_results(results: Results,
+                   destination: Destination,
+                   fmt: str = 'ndjson',
+                   chunk_rows: int = DEFAULT_CHUNK_ROWS) -> None:
+    """Write results to destination in the given format, chunk by chunk."""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{fmt}', expected one of {list(EXPORT_FORMATS)}")
+    EXPORT_FORMATS[fmt]['writer'](results, destination, chunk_rows)
@@ -0,0 +1,43 @@
+import glob
+import os
+from typing import Dict, List, Sequence
+import psutil
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+def cpu_topology() -> Dict[int, List[int]]:
+    """Map each socket (physical package) to its logical CPU ids."""
+    topology: Dict[int, List[int]] = {}
+    for path in glob.glob('/sys/devices/system/cpu/cpu[0-9]*/topology/physical_package_id'):
+        cpu = int(path.split('/')[-3][3:])
+        with open(path) as f:
+            topology.setdefault(int(f.read().strip()), []).append(cpu)
+
+    if not topology:
+        # No sysfs topology (non-Linux), treat the host as a single socket
+        topology[0] = list(range(psutil.cpu_count() or 1))
+
+    return {socket: sorted(cpus) for socket, cpus in sorted(topology.items())}
+
+def resolve_cores(cores: Sequence[int] = None, sockets: Sequence[int] = None) -> List[int]:
+    """Combine explicit cores and whole sockets into one sorted core list."""
+    selected = set(cores or [])
+    if sockets:
+        topology = cpu_topology()
+        for socket in sockets:
+            if socket not in topology:
+                raise ValueError(f"Unknown socket {socket}, host has {sorted(topology)}")
+            selected.update(topology[socket])
+    return sorted(selected)
+
+def pin_to_cores(cores: Sequence[int]) -> None:
+    """Pin the calling process (or worker thread on Linux) to the given cores."""
+    if not cores:
+        return
+    if hasattr(os, 'sched_setaffinity'):
+        os.sched_setaffinity(0, cores)
+    elif hasattr(psutil.Process, 'cpu_affinity'):
+        psutil.Process().cpu_affinity(list(cores))
+    else:
+        logger.warning("CPU affinity is not supported on this platform, running unpinned")
@@ -46,11 +46,20 @@ def main():
             
             # Generate test data and run benchmarks
             test_data = data_gen.generate_datasets(params)
-            results = engine.run_benchmarks(test_data, params)
-            
-            # Display results
-            results_view.display_results(results)
-            viz_dashboard.plot_metrics(results)
+            try:
+                results = engine.run_benchmarks(test_data, params)
+            finally:
+                engine.close()
+
+            # Keep results across reruns so exports don't need a new run
+            st.session_state['results'] = results
+            st.session_state['resource_timelines'] = engine.resource_timelines
+            results_view.clear_export()
+
+    if 'results' in st.session_state:
+        results = st.session_state['results']
+        results_view.display_results(results)
+        viz_dashboard.plot_metrics(results, st.session_state.get('resource_timelines'))
 
     logger.info("Application started")
 
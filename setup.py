@@ -12,4 +12,7 @@ setup(
         'psutil>=5.9.0',
         'pytest>=7.4.0',
     ],
+    extras_require={
+        'export': ['pyarrow>=14.0.0'],
+    },
 )
\ No newline at end of file
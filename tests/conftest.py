@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The app imports its packages as top-level `core` and `components`
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'app'))
@@ -0,0 +1,25 @@
+import random
+
+from core.algorithms.merge_sort import MergeSort
+from core.algorithms.parallel.parallel_merge import ParallelMergeSort
+
+
+def test_argsort_packs_negative_int_keys_stably():
+    keys = [3, -2, 3, 0, -2, 10 ** 9, 3]
+    order = ParallelMergeSort(2, backend='inline').argsort(keys)
+    assert order == sorted(range(len(keys)), key=lambda i: keys[i])
+
+
+def test_argsort_falls_back_for_string_keys():
+    keys = ['b', 'a', 'c', 'a']
+    assert ParallelMergeSort(2, backend='inline').argsort(keys) == [1, 3, 0, 2]
+
+
+def test_argsort_empty():
+    assert MergeSort().argsort([]) == []
+
+
+def test_sort_by_key_keeps_record_order_on_ties():
+    records = [(k, i) for i, k in enumerate(random.Random(3).choices(range(10), k=2000))]
+    for algorithm in (MergeSort(), ParallelMergeSort(2, backend='inline')):
+        assert algorithm.sort_by_key(records, lambda r: r[0]) == sorted(records, key=lambda r: r[0])
@@ -0,0 +1,38 @@
+import random
+
+import pytest
+
+from core.algorithms.parallel.backends import (
+    DEFAULT_BACKEND, InlineExecutor, available_backends, get_backend,
+)
+from core.algorithms.registry import registry
+
+
+def test_get_backend_defaults_and_rejects_unknown_names():
+    assert get_backend().name == DEFAULT_BACKEND
+    assert set(available_backends()) == {'process', 'thread', 'inline'}
+    with pytest.raises(ValueError, match='gpu'):
+        get_backend('gpu')
+
+
+def test_only_process_backend_pickles():
+    assert [name for name in available_backends() if get_backend(name).requires_pickling] == ['process']
+
+
+def test_inline_executor_runs_in_the_caller():
+    calls = []
+    with InlineExecutor() as executor:
+        future = executor.submit(calls.append, 1)
+        assert calls == [1] and future.done()
+        with pytest.raises(ZeroDivisionError):
+            executor.submit(divmod, 1, 0).result()
+
+
+@pytest.mark.parametrize('backend', ['process', 'thread', 'inline'])
+@pytest.mark.parametrize('key', ['parallel_merge_sort', 'parallel_quick_sort', 'parallel_bitonic_sort'])
+def test_parallel_algorithms_sort_on_every_backend(key, backend):
+    rng = random.Random(6)
+    data = [rng.randint(-10 ** 6, 10 ** 6) for _ in range(5000)]
+    algorithm = registry.create(key, 2, backend=backend)
+    assert algorithm.backend == backend
+    assert algorithm.sort(data) == sorted(data)
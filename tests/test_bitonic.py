@@ -0,0 +1,40 @@
+import random
+
+import pytest
+
+from core.algorithms.parallel.parallel_bitonic import ParallelBitonicSort
+
+
+@pytest.fixture(params=['inline', 'thread'])
+def sorter(request):
+    sorter = ParallelBitonicSort(4, backend=request.param)
+    sorter.min_block_size = 64  # Exercise the cross-block stages on small inputs
+    return sorter
+
+
+def test_sort_matches_sorted(sorter):
+    rng = random.Random(1)
+    for data in ([rng.randint(-10 ** 6, 10 ** 6) for _ in range(3001)], [rng.random() for _ in range(500)]):
+        assert sorter.sort(data) == sorted(data)
+
+
+def test_argsort_is_stable(sorter):
+    rng = random.Random(5)
+    for keys in ([rng.randint(0, 5) for _ in range(3000)], [rng.random() for _ in range(1000)] + [0.5] * 50):
+        assert sorter.argsort(keys) == sorted(range(len(keys)), key=lambda i: keys[i])
+
+
+def test_argsort_keeps_padding_behind_sentinel_keys(sorter):
+    keys = [2 ** 63 - 1, 0, 2 ** 63 - 1, -2 ** 63]
+    assert sorter.argsort(keys) == [3, 1, 0, 2]
+    assert sorter.argsort([float('inf'), 1.0, float('inf')]) == [1, 0, 2]
+
+
+def test_sort_by_key_keeps_record_order_on_ties(sorter):
+    records = [(k, i) for i, k in enumerate(random.Random(3).choices(range(10), k=2000))]
+    assert sorter.sort_by_key(records, lambda r: r[0]) == sorted(records, key=lambda r: r[0])
+
+
+def test_rejects_non_numeric_keys(sorter):
+    with pytest.raises(TypeError):
+        sorter.argsort(['b', 'a'])
@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+from core.algorithms.parallel.budget import merge_in_place, partition_in_place
+from core.algorithms.registry import registry
+
+
+class Keyed:
+    """Compares on key only, so stability is observable through tag."""
+
+    def __init__(self, key, tag):
+        self.key = key
+        self.tag = tag
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+    def __le__(self, other):
+        return self.key <= other.key
+
+    def __gt__(self, other):
+        return self.key > other.key
+
+
+@pytest.mark.parametrize('data', [
+    [5, 3, 8, 1, 9, 2],
+    [7] * 20,
+    list(range(50)),
+    list(range(50, 0, -1)),
+    [random.Random(seed).randint(0, 5) for seed in range(200)],
+])
+def test_partition_in_place_splits_around_pivot(data):
+    arr = list(data)
+    lt, gt = partition_in_place(arr, 0, len(arr))
+    assert sorted(arr) == sorted(data)
+    pivot = arr[lt]
+    assert all(x < pivot for x in arr[:lt])
+    assert all(x == pivot for x in arr[lt:gt])
+    assert all(x > pivot for x in arr[gt:])
+    assert lt < gt
+
+
+def test_partition_in_place_respects_bounds():
+    arr = [9, 9, 3, 1, 2, 0, 0]
+    partition_in_place(arr, 2, 5)
+    assert arr[:2] == [9, 9] and arr[5:] == [0, 0]
+    assert sorted(arr[2:5]) == [1, 2, 3]
+
+
+@pytest.mark.parametrize('buffer_items', [0, 1, 3, 16, 1000])
+def test_merge_in_place_merges_sorted_runs(buffer_items):
+    rng = random.Random(buffer_items)
+    for _ in range(50):
+        left = sorted(rng.randint(0, 20) for _ in range(rng.randint(0, 40)))
+        right = sorted(rng.randint(0, 20) for _ in range(rng.randint(0, 40)))
+        arr = [-1] + left + right + [99]
+        merge_in_place(arr, 1, 1 + len(left), 1 + len(left) + len(right), buffer_items)
+        assert arr == [-1] + sorted(left + right) + [99]
+
+
+@pytest.mark.parametrize('buffer_items', [1, 4, 1000])
+def test_merge_in_place_is_stable(buffer_items):
+    rng = random.Random(7)
+    left = sorted((Keyed(rng.randint(0, 5), ('L', i)) for i in range(30)), key=lambda k: k.key)
+    right = sorted((Keyed(rng.randint(0, 5), ('R', i)) for i in range(30)), key=lambda k: k.key)
+    arr = left + right
+    merge_in_place(arr, 0, len(left), len(arr), buffer_items)
+
+    expected = sorted(left + right, key=lambda k: k.key)  # sorted() is stable
+    assert [k.tag for k in arr] == [k.tag for k in expected]
+
+
+@pytest.mark.parametrize('key', ['parallel_quick_sort', 'parallel_merge_sort'])
+@pytest.mark.parametrize('budget_mb', [0.05, 1.0])
+@pytest.mark.parametrize('order', ['sorted', 'reverse_sorted', 'few_unique'])
+def test_budgeted_sort_end_to_end(key, budget_mb, order):
+    data = {
+        'sorted': list(range(20000)),
+        'reverse_sorted': list(range(20000, 0, -1)),
+        'few_unique': random.Random(2).choices(range(4), k=20000),
+    }[order]
+    algorithm = registry.create(key, 2, backend='thread', memory_budget_mb=budget_mb)
+    assert algorithm.needs_budgeting(len(data))
+    assert algorithm.sort(data) == sorted(data)
+    assert 'memory_strategy' in algorithm.last_run_stats
@@ -0,0 +1,59 @@
+from core.algorithms.parallel.parallel_merge import ParallelMergeSort
+from core.benchmark.checkpoint import BenchmarkCheckpoint
+from core.benchmark.engine import BenchmarkEngine
+from core.data.generator import DataGenerator
+
+PARAMS = {
+    'num_trials': 2,
+    'algorithms': ['merge_sort', 'parallel_merge_sort'],
+    'backends': ['inline'],
+    'monitor_resources': False,
+}
+
+
+def _datasets():
+    generator = DataGenerator()
+    return {size: generator.generate_special_case(size, 'random') for size in (1500, 3000)}
+
+
+def test_resume_skips_completed_cells(tmp_path, monkeypatch):
+    path = tmp_path / 'sweep.jsonl'
+    params = {**PARAMS, 'checkpoint': path}
+    datasets = _datasets()
+    first = BenchmarkEngine(2).run_benchmarks(datasets, params)
+    assert len(BenchmarkCheckpoint(path)) == len(first) == 8
+
+    calls = []
+    original = ParallelMergeSort.sort
+    monkeypatch.setattr(ParallelMergeSort, 'sort', lambda self, data: calls.append(1) or original(self, data))
+    resumed = BenchmarkEngine(2).run_benchmarks(datasets, params)
+
+    assert calls == []
+    assert resumed['config_hash'].tolist() == first['config_hash'].tolist()
+    assert resumed['execution_time'].tolist() == first['execution_time'].tolist()
+
+
+def test_changed_parameters_rerun(tmp_path):
+    path = tmp_path / 'sweep.jsonl'
+    datasets = _datasets()
+    BenchmarkEngine(2).run_benchmarks(datasets, {**PARAMS, 'checkpoint': path})
+    BenchmarkEngine(2).run_benchmarks(datasets, {**PARAMS, 'checkpoint': path, 'memory_budget_mb': 64})
+    assert len(BenchmarkCheckpoint(path)) == 16
+
+
+def test_truncated_last_line_is_ignored(tmp_path):
+    path = tmp_path / 'sweep.jsonl'
+    checkpoint = BenchmarkCheckpoint(path)
+    checkpoint.record('abc', {'trial': 1}, {'execution_time': 0.5})
+    with open(path, 'a') as f:
+        f.write('{"config_hash": "def", "row": {"exec')
+
+    reloaded = BenchmarkCheckpoint(path)
+    assert 'abc' in reloaded and 'def' not in reloaded
+    assert reloaded.get('abc') == {'execution_time': 0.5}
+
+    # The next cell must not be appended onto the partial line
+    reloaded.record('ghi', {'trial': 2}, {'execution_time': 0.25})
+    resumed = BenchmarkCheckpoint(path)
+    assert len(resumed) == 2
+    assert resumed.get('ghi') == {'execution_time': 0.25}
@@ -0,0 +1,62 @@
+import io
+
+import pandas as pd
+import pytest
+
+from core.export import available_formats, export_results, iter_csv
+
+
+@pytest.fixture
+def results():
+    return pd.DataFrame({
+        'algorithm': ['Merge Sort', 'Quick Sort', 'Parallel Merge Sort'] * 5,
+        'input_size': [1000, 2000, 3000] * 5,
+        'execution_time': [0.001 * i for i in range(15)],
+        'within_budget': [True, False, None] * 5,
+    })
+
+
+def test_ndjson_round_trip(results, tmp_path):
+    path = tmp_path / 'results.ndjson'
+    export_results(results, path, 'ndjson', chunk_rows=4)
+    loaded = pd.read_json(path, lines=True)
+    assert len(loaded) == len(results)
+    assert loaded['execution_time'].tolist() == pytest.approx(results['execution_time'].tolist())
+
+
+def test_csv_has_one_header_across_chunks(results):
+    buffer = io.BytesIO()
+    export_results(results, buffer, 'csv', chunk_rows=4)
+    text = buffer.getvalue().decode()
+    assert text.count('algorithm,') == 1
+    pd.testing.assert_frame_equal(pd.read_csv(io.StringIO(text))[['algorithm', 'input_size']],
+                                  results[['algorithm', 'input_size']])
+
+
+def test_iterable_of_frames_is_streamed(results):
+    chunks = list(iter_csv(iter([results.iloc[:5], results.iloc[5:]])))
+    assert len(chunks) == 2 and not chunks[1].startswith(b'algorithm')
+
+
+@pytest.mark.parametrize('fmt', ['parquet', 'arrow'])
+def test_pyarrow_formats_round_trip(results, tmp_path, fmt):
+    pa = pytest.importorskip('pyarrow')
+    path = tmp_path / f'results.{fmt}'
+    export_results(results, path, fmt, chunk_rows=4)
+    if fmt == 'parquet':
+        import pyarrow.parquet as pq
+        loaded = pq.read_table(path).to_pandas()
+        assert pq.ParquetFile(path).num_row_groups == 4
+    else:
+        with pa.OSFile(str(path), 'rb') as source:
+            loaded = pa.ipc.open_stream(source).read_all().to_pandas()
+    pd.testing.assert_frame_equal(loaded, results)
+
+
+def test_available_formats_always_include_text_formats():
+    assert {'ndjson', 'csv'} <= set(available_formats())
+
+
+def test_unknown_format_is_rejected(results, tmp_path):
+    with pytest.raises(ValueError, match='xlsx'):
+        export_results(results, tmp_path / 'results.xlsx', 'xlsx')
@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+from core.algorithms.parallel.ipc import IPCProfiler, ProfiledExecutor, make_executor
+from core.algorithms.parallel.parallel_quick import ParallelQuickSort
+
+
+def test_process_backend_records_payload_bytes():
+    profiler = IPCProfiler()
+    with make_executor(2, profiler, 'process') as executor:
+        assert isinstance(executor, ProfiledExecutor)
+        assert list(executor.map(sorted, [[3, 1, 2], [5, 4]])) == [[1, 2, 3], [4, 5]]
+
+    summary = profiler.summary()
+    assert summary['ipc_tasks'] == 2
+    assert summary['ipc_bytes_sent'] > 0 and summary['ipc_bytes_received'] > 0
+    assert 0.0 <= summary['ipc_communication_ratio'] <= 1.0
+
+
+@pytest.mark.parametrize('backend', ['thread', 'inline'])
+def test_shared_memory_backends_record_timings_only(backend):
+    profiler = IPCProfiler()
+    with make_executor(2, profiler, backend) as executor:
+        assert executor.submit(sorted, [2, 1]).result() == [1, 2]
+
+    summary = profiler.summary()
+    assert summary['ipc_tasks'] == 1
+    assert summary['ipc_bytes_sent'] == summary['ipc_bytes_received'] == 0
+
+
+def test_task_errors_reach_the_caller():
+    with make_executor(2, IPCProfiler(), 'process') as executor:
+        with pytest.raises(ZeroDivisionError):
+            executor.submit(divmod, 1, 0).result()
+
+
+def test_no_profiler_returns_plain_executor():
+    with make_executor(2, None, 'thread') as executor:
+        assert not isinstance(executor, ProfiledExecutor)
+
+
+def test_parallel_quick_sort_profiles_every_leaf():
+    rng = random.Random(4)
+    data = [rng.randint(0, 10 ** 6) for _ in range(20000)]
+    algorithm = ParallelQuickSort(4, backend='process')
+    algorithm.profiler = IPCProfiler()
+    assert algorithm.sort(data) == sorted(data)
+
+    leaf_size = -(-len(data) // algorithm.num_processes)
+    leaves = [part for part, needs_sort in algorithm._split_leaves(data, leaf_size) if needs_sort]
+    summary = algorithm.profiler.summary()
+    assert summary['ipc_tasks'] == len(leaves)
+    # Every element crosses the boundary once in each direction
+    assert summary['ipc_bytes_sent'] >= 2 * len(data)
+
+
+def test_reset_clears_records():
+    profiler = IPCProfiler()
+    profiler.record({'bytes_sent': 1, 'bytes_received': 1, 'serialize_time': 0.0,
+                     'deserialize_time': 0.0, 'worker_serialize_time': 0.0,
+                     'worker_deserialize_time': 0.0, 'queue_wait': 0.0, 'compute_time': 0.1})
+    profiler.reset()
+    assert profiler.summary()['ipc_tasks'] == 0
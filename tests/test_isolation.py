@@ -0,0 +1,40 @@
+import random
+
+import pytest
+
+from core.algorithms.merge_sort import MergeSort
+from core.algorithms.parallel.parallel_bitonic import ParallelBitonicSort
+from core.algorithms.parallel.parallel_merge import ParallelMergeSort
+from core.benchmark.isolation import IsolatedTrialRunner, run_trial
+
+
+def test_run_trial_reports_cold_and_warm_timings():
+    trial = run_trial(ParallelMergeSort(2, backend='thread'), list(range(3000, 0, -1)), warm_runs=2)
+    assert trial['cold_time'] > 0
+    assert len(trial['warm_times']) == 2
+    assert trial['peak_rss_mb'] > 0
+    assert trial['memory_delta_mb'] is not None
+
+
+@pytest.mark.parametrize('start_method', ['spawn', 'forkserver'])
+def test_isolated_trial_runs_in_a_child(start_method):
+    rng = random.Random(8)
+    data = [rng.randint(0, 10 ** 6) for _ in range(2000)]
+    runner = IsolatedTrialRunner(start_method, warm_runs=2, timeout=60)
+    trial = runner.run(MergeSort(), data)
+
+    summary = runner.summarize(trial)
+    assert summary['warm_runs'] == 2
+    assert summary['cold_time'] == trial['cold_time']
+    assert summary['cold_penalty'] == pytest.approx(trial['cold_time'] / summary['warm_time'])
+
+
+def test_child_errors_are_raised_in_the_parent():
+    runner = IsolatedTrialRunner('spawn', warm_runs=0, timeout=60)
+    with pytest.raises(RuntimeError, match='TypeError'):
+        runner.run(ParallelBitonicSort(2, backend='inline'), ['b', 'a'])
+
+
+def test_summarize_without_warm_runs():
+    summary = IsolatedTrialRunner.summarize({'cold_time': 0.5, 'warm_times': []})
+    assert summary['warm_time'] is None and summary['cold_penalty'] is None
@@ -0,0 +1,72 @@
+import multiprocessing
+import os
+import time
+
+import psutil
+import pytest
+
+from core.benchmark.monitor import ResourceMonitor
+from core.utils.affinity import cpu_topology, pin_to_cores, resolve_cores
+
+
+def test_memory_delta_counts_allocations_in_this_process():
+    with ResourceMonitor(interval=0.01) as monitor:
+        block = bytearray(32 * 1024 * 1024)
+        time.sleep(0.05)
+    del block
+    assert 24 <= monitor.summary()['memory_delta_mb'] <= 64
+
+
+def test_memory_delta_is_none_when_workers_start_mid_trial():
+    process = multiprocessing.get_context('spawn').Process(target=time.sleep, args=(0.5,))
+    with ResourceMonitor(interval=0.01) as monitor:
+        process.start()
+        time.sleep(0.1)
+    process.join()
+    assert monitor.summary()['memory_delta_mb'] is None
+
+
+def test_summary_aggregates_the_timeline():
+    with ResourceMonitor(interval=0.01) as monitor:
+        sum(i * i for i in range(300000))
+
+    summary = monitor.summary()
+    cores = psutil.cpu_count()
+    assert summary['monitor_samples'] == len(monitor.timeline) >= 1
+    assert len(summary['per_core_utilization']) == cores
+    assert 0.0 <= summary['cpu_utilization'] <= 100.0
+    assert summary['peak_rss_mb'] >= summary['mean_rss_mb'] > 0
+    assert summary['voluntary_ctx_switches'] >= 0
+    assert all(len(sample['per_core']) == cores for sample in monitor.timeline)
+
+
+def test_summary_is_empty_before_sampling():
+    assert ResourceMonitor().summary() == {}
+
+
+def test_resolve_cores_combines_cores_and_sockets():
+    topology = cpu_topology()
+    socket, cpus = next(iter(topology.items()))
+    assert resolve_cores([cpus[0], cpus[0]]) == [cpus[0]]
+    assert resolve_cores(sockets=[socket]) == cpus
+    assert resolve_cores() == []
+    with pytest.raises(ValueError):
+        resolve_cores(sockets=[max(topology) + 1])
+
+
+def test_cpu_topology_lists_each_cpu_once():
+    cpus = [cpu for socket_cpus in cpu_topology().values() for cpu in socket_cpus]
+    assert len(cpus) == len(set(cpus)) >= 1
+
+
+@pytest.mark.skipif(not hasattr(os, 'sched_setaffinity'), reason="needs sched_setaffinity")
+def test_pin_to_cores_restricts_the_calling_thread():
+    original = os.sched_getaffinity(0)
+    core = min(original)
+    try:
+        pin_to_cores([core])
+        assert os.sched_getaffinity(0) == {core}
+        pin_to_cores([])  # No cores leaves the affinity alone
+        assert os.sched_getaffinity(0) == {core}
+    finally:
+        os.sched_setaffinity(0, original)
@@ -0,0 +1,19 @@
+"""
+Throughput regression gate. Record a baseline on this machine first:
+
+    cd app && python -m core.benchmark.regression --update-baseline
+"""
+
+import pytest
+
+from core.benchmark.regression import BenchmarkRegressionError, RegressionSuite
+
+
+def test_no_throughput_regression():
+    suite = RegressionSuite()
+    if not suite.baseline_path.exists():
+        pytest.skip(f"No baseline for machine profile {suite.profile['id']}")
+    try:
+        suite.check()
+    except BenchmarkRegressionError as e:
+        pytest.fail(str(e))
@@ -0,0 +1,104 @@
+import random
+import socket
+import time
+
+import pytest
+
+from core.algorithms.distributed import DistributedSampleSort, SortWorker
+from core.algorithms.distributed.protocol import (
+    HEADER, OP_COLLECT, OP_LOAD, OP_SPLIT, ProtocolError, decode_ints, encode_ints, recv_message,
+    send_message,
+)
+from core.benchmark.engine import BenchmarkEngine
+
+
+def test_int_encoding_round_trip():
+    values = [0, 1, -1, 2 ** 63 - 1, -2 ** 63, 42]
+    encoded = encode_ints(values)
+    assert len(encoded) == 8 * len(values)
+    assert encoded[:8] == (0).to_bytes(8, 'little')
+    assert decode_ints(encoded) == values
+
+
+def test_decode_rejects_partial_ints():
+    with pytest.raises(ProtocolError):
+        decode_ints(b'\x00' * 7)
+
+
+def test_message_round_trip():
+    left, right = socket.socketpair()
+    with left, right:
+        sent = send_message(left, OP_LOAD, {'job': 'a', 'sample_size': 4}, [3, 1, 2])
+        opcode, meta, values, received = recv_message(right)
+    assert (opcode, meta, values) == (OP_LOAD, {'job': 'a', 'sample_size': 4}, [3, 1, 2])
+    assert sent == received
+
+
+def test_oversized_payload_is_rejected_before_reading():
+    left, right = socket.socketpair()
+    with left, right:
+        left.sendall(HEADER.pack(OP_LOAD, 0, 1 << 40))
+        with pytest.raises(ProtocolError):
+            recv_message(right)
+
+
+def test_truncated_message_raises():
+    left, right = socket.socketpair()
+    with right:
+        left.sendall(HEADER.pack(OP_LOAD, 0, 16) + b'\x00' * 8)
+        left.close()
+        with pytest.raises(ProtocolError):
+            recv_message(right)
+
+
+def test_distributed_sample_sort_on_local_cluster():
+    rng = random.Random(1)
+    data = [rng.randint(-10 ** 12, 10 ** 12) for _ in range(5000)] + [7] * 500
+    sorter = DistributedSampleSort(num_nodes=3)
+    try:
+        assert sorter.sort(data) == sorted(data)
+        assert sorter.last_run_stats['num_nodes'] == 3
+    finally:
+        sorter.close()
+
+
+def test_abandoned_jobs_expire():
+    worker = SortWorker(job_ttl=0.05).start()
+    try:
+        worker.dispatch(OP_LOAD, {'job': 'abandoned', 'sample_size': 2}, [3, 1, 2])
+        time.sleep(0.1)
+        worker.dispatch(OP_LOAD, {'job': 'next', 'sample_size': 2}, [5, 4])
+        assert list(worker._jobs) == ['next']
+    finally:
+        worker.stop()
+
+
+def test_collect_timeout_drops_job():
+    worker = SortWorker(timeout=0.05).start()
+    try:
+        worker.dispatch(OP_LOAD, {'job': 'a', 'sample_size': 1}, [1])
+        with pytest.raises(TimeoutError):
+            worker.dispatch(OP_COLLECT, {'job': 'a', 'sources': 2}, [])
+        assert 'a' not in worker._jobs
+    finally:
+        worker.stop()
+
+
+def test_split_refuses_non_loopback_peers():
+    worker = SortWorker().start()
+    try:
+        worker.dispatch(OP_LOAD, {'job': 'a', 'sample_size': 1}, [1])
+        with pytest.raises(PermissionError):
+            worker.dispatch(OP_SPLIT, {'job': 'a', 'rank': 0, 'peers': [('10.0.0.1', 9500)]}, [])
+    finally:
+        worker.stop()
+
+
+def test_engine_close_stops_local_cluster():
+    engine = BenchmarkEngine()
+    engine._benchmark_cases({'algorithms': [], 'distributed_nodes': 2})
+    engine.distributed._addresses()
+    cluster = engine.distributed._cluster
+    engine.close()
+    assert engine.distributed is None
+    assert cluster.workers == []
@@ -0,0 +1,88 @@
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from core.algorithms.registry import AlgorithmRegistry, AlgorithmSpec, registry
+from core.data.generator import DataGenerator
+
+# core.algorithms re-exports the registry instance under the module's name
+registry_module = importlib.import_module('core.algorithms.registry')
+
+APP_DIR = Path(__file__).resolve().parents[1] / 'app'
+
+
+class FakeEntryPoint:
+    def __init__(self, name, loaded):
+        self.name = name
+        self._loaded = loaded
+
+    def load(self):
+        if isinstance(self._loaded, Exception):
+            raise self._loaded
+        return self._loaded
+
+
+def _plugin_specs():
+    return [AlgorithmSpec('plugin_sort', 'Plugin Sort', 'core.algorithms.merge_sort:MergeSort', stable=True)]
+
+
+@pytest.mark.parametrize('key', registry.keys())
+@pytest.mark.parametrize('case', DataGenerator().special_cases)
+def test_registered_algorithms_sort_special_cases(key, case):
+    algorithm = registry.create(key, 2)
+    if hasattr(algorithm, 'backend'):
+        algorithm.backend = 'inline'
+    data = DataGenerator().generate_special_case(3000, case)
+    assert algorithm.sort(data) == sorted(data)
+
+
+def test_implementations_are_imported_on_first_use():
+    script = (
+        "import sys\n"
+        "from core.algorithms import AVAILABLE_ALGORITHMS, registry\n"
+        "assert list(AVAILABLE_ALGORITHMS) == registry.keys()\n"
+        "assert not any(spec.is_loaded for spec in registry)\n"
+        "assert 'core.algorithms.parallel.parallel_bitonic' not in sys.modules\n"
+        "registry.create('merge_sort')\n"
+        "assert registry.get('merge_sort').is_loaded\n"
+        "assert 'core.algorithms.parallel.parallel_bitonic' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, '-c', script], cwd=APP_DIR, check=True)
+
+
+def test_get_by_key_or_display_name():
+    assert registry.get('Parallel Quick Sort') is registry.get('parallel_quick_sort')
+    with pytest.raises(KeyError):
+        registry.get('bogo_sort')
+
+
+def test_filter_by_capabilities():
+    assert [spec.key for spec in registry.filter(parallel=False)] == ['merge_sort', 'quick_sort']
+    assert 'parallel_bitonic_sort' not in [spec.key for spec in registry.filter(dtype='record')]
+    assert [spec.key for spec in registry.filter(['Merge Sort', 'quick_sort'], stable=True)] == ['merge_sort']
+
+
+def test_duplicate_keys_are_rejected():
+    specs = AlgorithmRegistry(group=None)
+    specs.register(AlgorithmSpec('a', 'A', '.merge_sort:MergeSort'))
+    with pytest.raises(ValueError):
+        specs.register(AlgorithmSpec('a', 'Another A', '.quick_sort:QuickSort'))
+
+
+def test_entry_point_plugins_are_discovered_and_broken_ones_skipped(monkeypatch):
+    entry_points = [
+        FakeEntryPoint('good', _plugin_specs),
+        FakeEntryPoint('single', AlgorithmSpec('single_sort', 'Single Sort', '.quick_sort:QuickSort')),
+        FakeEntryPoint('broken', ImportError('missing dependency')),
+    ]
+    monkeypatch.setattr(registry_module, 'entry_points', lambda group: entry_points)
+
+    plugins = AlgorithmRegistry([AlgorithmSpec('merge_sort', 'Merge Sort', '.merge_sort:MergeSort')])
+    assert plugins.keys() == ['merge_sort', 'plugin_sort', 'single_sort']
+    spec = plugins.get('Plugin Sort')
+    assert not spec.is_loaded
+    assert plugins.create('plugin_sort').sort([3, 1, 2]) == [1, 2, 3]
+    assert spec.is_loaded
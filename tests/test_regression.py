@@ -0,0 +1,79 @@
+import json
+import math
+
+import pytest
+
+from core.benchmark.regression import (
+    BaselineVersionError, BenchmarkRegressionError, RegressionSuite, main, welch_t_test,
+)
+
+
+def test_welch_t_test_matches_reference_values():
+    # Reference values from scipy.stats.ttest_ind(equal_var=False, alternative='greater')
+    t, p = welch_t_test([10.1, 9.8, 10.3, 10.0, 9.9], [9.0, 9.4, 8.8, 9.1, 9.3])
+    assert t == pytest.approx(6.563924617405258)
+    assert p == pytest.approx(0.00010691110050433505, rel=1e-6)
+
+    t, p = welch_t_test([1, 2, 3, 4, 5, 6], [2, 3, 4, 5, 6, 7, 8, 9])
+    assert t == pytest.approx(-1.7320508075688774)
+    assert p == pytest.approx(0.9455451545588309, rel=1e-6)
+
+
+def test_welch_t_test_constant_samples():
+    assert welch_t_test([5, 5], [5, 5]) == (0.0, 1.0)
+    assert welch_t_test([5, 5], [4, 4]) == (math.inf, 0.0)
+
+
+def test_welch_t_test_needs_two_samples():
+    with pytest.raises(ValueError):
+        welch_t_test([1.0], [1.0, 2.0])
+
+
+def test_main_rejects_single_trial():
+    with pytest.raises(SystemExit):
+        main(['--trials', '1'])
+
+
+def _suite(tmp_path):
+    return RegressionSuite(
+        algorithms=['merge_sort', 'parallel_merge_sort'],
+        cases=['random', 'sorted'],
+        sizes=[2000],
+        trials=3,
+        num_processes=2,
+        baseline_dir=tmp_path,
+    )
+
+
+def test_check_passes_against_own_baseline(tmp_path):
+    suite = _suite(tmp_path)
+    results = suite.run()
+    suite.save_baseline(results)
+    comparison = suite.check(results)
+    assert not comparison['regressed'].any()
+    assert set(comparison['cell']) == set(results)
+
+
+def test_check_raises_on_slowdown(tmp_path):
+    suite = _suite(tmp_path)
+    baseline = {'merge_sort|random|2000': [1000.0, 1010.0, 990.0]}
+    suite.save_baseline(baseline)
+    with pytest.raises(BenchmarkRegressionError) as excinfo:
+        suite.check({'merge_sort|random|2000': [500.0, 505.0, 495.0]})
+    assert excinfo.value.comparison['regressed'].all()
+
+
+def test_check_requires_baseline(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        _suite(tmp_path).check({})
+
+
+def test_baseline_from_older_registry_is_refused(tmp_path):
+    suite = _suite(tmp_path)
+    suite.save_baseline({'merge_sort|random|2000': [1000.0, 1010.0, 990.0]})
+    stored = json.loads(suite.baseline_path.read_text())
+    del stored['registry_version']
+    suite.baseline_path.write_text(json.dumps(stored))
+
+    with pytest.raises(BaselineVersionError):
+        suite.load_baseline()
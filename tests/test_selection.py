@@ -0,0 +1,24 @@
+import random
+
+import pytest
+
+from core.algorithms.parallel.parallel_select import ParallelSelect
+
+
+@pytest.mark.parametrize('backend', ['inline', 'thread'])
+def test_nth_element_and_quantiles(backend):
+    rng = random.Random(11)
+    selector = ParallelSelect(2, backend=backend)
+    for data in ([rng.randint(0, 10 ** 6) for _ in range(5000)], [4] * 3000, [rng.randint(0, 3) for _ in range(4000)]):
+        expected = sorted(data)
+        for n in (0, len(data) // 2, len(data) - 1):
+            assert selector.nth_element(data, n) == expected[n]
+        assert selector.select_quantiles(data, [0.0, 0.5, 1.0]) == [
+            expected[0], expected[round(0.5 * (len(data) - 1))], expected[-1]
+        ]
+        assert selector.top_k(data, 10) == expected[:10]
+
+
+def test_nth_element_rejects_out_of_range_index():
+    with pytest.raises((IndexError, ValueError)):
+        ParallelSelect(2, backend='inline').nth_element([1, 2, 3], 3)
@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from core.algorithms.streaming import StreamingSorter, merge_runs
+from core.algorithms.merge_sort import MergeSort
+
+
+def _batches(seed, count=40, size=250):
+    rng = random.Random(seed)
+    return [[rng.randint(0, 10 ** 6) for _ in range(size)] for _ in range(count)]
+
+
+@pytest.mark.parametrize('backend', ['thread', 'inline', 'process'])
+def test_iter_sorted_returns_every_ingested_item(backend):
+    batches = _batches(1)
+    with StreamingSorter(fanout=4, max_pending_runs=8, backend=backend) as sorter:
+        for batch in batches:
+            sorter.ingest(batch)
+        sorter.flush()
+        assert list(sorter.iter_sorted()) == sorted(x for batch in batches for x in batch)
+        metrics = sorter.get_metrics()
+
+    assert metrics['items_ingested'] == 40 * 250
+    assert metrics['batches_ingested'] == 40
+    assert metrics['compactions'] >= 40 // 4
+    # Compaction keeps the number of runs logarithmic in the batch count
+    assert metrics['runs'] < 40 // 4
+
+
+def test_queries_see_runs_while_compacting():
+    with StreamingSorter(fanout=2, max_pending_runs=2) as sorter:
+        seen = []
+        for batch in _batches(2, count=10, size=50):
+            sorter.ingest(batch)
+            seen.append(len(list(sorter.iter_sorted())))
+    assert seen == [50 * (i + 1) for i in range(10)]
+
+
+def test_empty_batches_are_counted_but_not_stored():
+    with StreamingSorter() as sorter:
+        sorter.ingest([])
+        assert sorter.get_metrics()['batches_ingested'] == 1
+        assert list(sorter.iter_sorted()) == []
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        StreamingSorter(fanout=1)
+    with pytest.raises(ValueError):
+        StreamingSorter(fanout=4, max_pending_runs=2)
+
+
+def test_merge_runs_handles_odd_run_counts():
+    assert merge_runs(MergeSort(), [[1, 4], [2], [0, 3, 5]]) == [0, 1, 2, 3, 4, 5]